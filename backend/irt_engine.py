@@ -30,18 +30,610 @@ Key Features:
 """
 
 import math
+from bisect import bisect_right
 import numpy as np
-from typing import List, Tuple, Dict, Optional, Any
+from typing import List, Tuple, Dict, Optional, Any, Union
 from collections import deque
-from functools import lru_cache
 from enum import Enum
+from types import MappingProxyType
 from dataclasses import dataclass
 import logging
+import os
 import time
 import random
 
+# numba is an optional accelerator and is not in requirements.txt: without it
+# (the default deployment) the Newton-Raphson loop and its derivative kernels
+# run as the plain Python/NumPy functions below. Installing numba compiles the
+# same functions; results agree to within floating-point rounding.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Default 3PL guessing parameter; nearly every item in our banks uses it
+_DEFAULT_GUESSING = 0.25
+_DEFAULT_ONE_MINUS_C = 1.0 - _DEFAULT_GUESSING
+_DEFAULT_ONE_MINUS_C_SQ = _DEFAULT_ONE_MINUS_C ** 2
+
+# theta_to_tier bins: theta < -1 -> C1, [-1, 0) -> C2, [0, 1) -> C3, >= 1 -> C4
+_TIER_LABELS = ("C1", "C2", "C3", "C4")
+_TIER_THETA_EDGES = (-1.0, 0.0, 1.0)
+_TIER_INDEX = {tier: index for index, tier in enumerate(_TIER_LABELS)}
+_TIER_LABEL_ARRAY = np.array(_TIER_LABELS)
+_TIER_THETA_EDGE_ARRAY = np.array(_TIER_THETA_EDGES)
+# Outer theta bounds of each tier, used to clamp anticipated theta to one tier step
+_TIER_BOUNDARIES = (-3.0,) + _TIER_THETA_EDGES + (3.0,)
+
+# Indexed by the level codes computed in generate_diagnostic_report
+_STRENGTH_LEVELS = ("Strong", "Weak", "Moderate")
+
+
+def _prob_3pl_c025(theta: float, difficulty: float, discrimination: float) -> float:
+    """3PL probability with c fixed at 0.25 (theta/discrimination already clamped)"""
+    exponent = discrimination * (theta - difficulty)
+    if exponent > 700:
+        return 1.0
+    elif exponent < -700:
+        return _DEFAULT_GUESSING
+    probability = _DEFAULT_GUESSING + (1 - _DEFAULT_GUESSING) / (1 + math.exp(-exponent))
+    # Only a NaN exponent gets past this, and the general path maps it to 1.0
+    return probability if probability < 1.0 else 1.0
+
+
+def _probability_3pl(theta: float, difficulty: float,
+                     discrimination: float, guessing: float = 0.25) -> float:
+    """Scalar 3PL probability with the engine's parameter clamps applied"""
+    try:
+        # Conditional expressions in place of max(lo, min(hi, x)): the same results
+        # (NaN included) without two builtin calls per clamp on this hot scalar path
+        theta = theta if theta < 5 else 5
+        theta = theta if theta > -5 else -5
+        discrimination = discrimination if discrimination < 3.0 else 3.0
+        discrimination = discrimination if discrimination > 0.1 else 0.1
+        if guessing == _DEFAULT_GUESSING:
+            return _prob_3pl_c025(theta, difficulty, discrimination)
+        guessing = guessing if guessing < 0.4 else 0.4
+        guessing = guessing if guessing > 0 else 0
+
+        exponent = discrimination * (theta - difficulty)
+
+        if exponent > 700:
+            return 1.0
+        elif exponent < -700:
+            return guessing
+        else:
+            exp_term = math.exp(-exponent)
+            probability = guessing + (1 - guessing) / (1 + exp_term)
+            probability = probability if probability < 1.0 else 1.0
+            return probability if probability > guessing else guessing
+
+    except (OverflowError, ZeroDivisionError, ValueError) as e:
+        logger.warning(f"Error in probability calculation: {e}")
+        return 0.5
+
+
+def _info_3pl_c025(p: float, discrimination: float) -> float:
+    """Fisher information with c fixed at 0.25, given p from _prob_3pl_c025"""
+    if p <= _DEFAULT_GUESSING or p >= 1.0:
+        return 0.0
+    # Same operation order as the general path and _information_vec, so results match bit for bit
+    p_star = (p - _DEFAULT_GUESSING) / _DEFAULT_ONE_MINUS_C
+    p_star = p_star if p_star < 1 - 1e-10 else 1 - 1e-10
+    p_star = p_star if p_star > 1e-10 else 1e-10
+    info = (discrimination ** 2) * (p_star * (1 - p_star)) / _DEFAULT_ONE_MINUS_C_SQ
+    return info if info < 100.0 else 100.0
+
+
+def _probability_vec(theta, difficulty: np.ndarray, discrimination: np.ndarray,
+                     guessing: np.ndarray) -> np.ndarray:
+    """Vectorised probability_correct; discrimination and guessing must already be clamped"""
+    theta = np.clip(theta, -5, 5)
+    exponent = np.clip(discrimination * (theta - difficulty), -700, 700)
+    probability = guessing + (1 - guessing) / (1 + np.exp(-exponent))
+    return np.minimum(np.maximum(probability, guessing), 1.0)
+
+
+def _information_vec(theta, difficulty: np.ndarray, discrimination: np.ndarray,
+                     guessing: np.ndarray) -> np.ndarray:
+    """Vectorised IRTEngine.information (same clamps and cap, no rounding cache)"""
+    p = _probability_vec(theta, difficulty,
+                         np.clip(discrimination, 0.1, 3.0), np.clip(guessing, 0.0, 0.4))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_star = np.clip((p - guessing) / (1 - guessing), 1e-10, 1 - 1e-10)
+        info = np.minimum(100.0, (discrimination ** 2) * (p_star * (1 - p_star)) / (1 - guessing) ** 2)
+    return np.where((p <= guessing) | (p >= 1.0), 0.0, info)
+
+
+def _nr_derivatives_numpy(theta: float, is_correct: np.ndarray, difficulty: np.ndarray,
+                          discrimination: np.ndarray, guessing: np.ndarray,
+                          epsilon: float) -> Tuple[float, float]:
+    """First and second log-likelihood derivatives used by the Newton-Raphson update"""
+    p = _probability_vec(theta, difficulty, discrimination, guessing)
+    p = np.clip(p, epsilon, 1.0 - epsilon)
+    pq = p * (1 - p)
+
+    # a*q/p if correct, -a*p/q if not: with r = y - p both are a*r*|r|/(p*q),
+    # which shares p*q with the second derivative and needs no branch mask
+    residual = is_correct - p
+    likelihood_derivative = float(np.sum(discrimination * residual * np.abs(residual) / pq))
+    second_derivative = -float(np.sum(discrimination * discrimination * pq))
+    return likelihood_derivative, second_derivative
+
+
+def _min_curvature_numpy(theta_a: float, theta_b: float, difficulty: np.ndarray,
+                         discrimination: np.ndarray, guessing: np.ndarray,
+                         epsilon: float) -> float:
+    """Lower bound of sum(a^2 p q) for theta between theta_a and theta_b (p*q is unimodal in theta)"""
+    p = _probability_vec(np.array([[theta_a], [theta_b]]), difficulty, discrimination, guessing)
+    p = np.clip(p, epsilon, 1.0 - epsilon)
+    return float(np.sum(discrimination ** 2 * (p * (1 - p)).min(axis=0)))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _nr_derivatives(theta, is_correct, difficulty, discrimination, guessing, epsilon):
+        """Compiled single-pass version of _nr_derivatives_numpy"""
+        theta = min(max(theta, -5.0), 5.0)
+        likelihood_derivative = 0.0
+        second_derivative = 0.0
+        for i in range(difficulty.shape[0]):
+            a = discrimination[i]
+            c = guessing[i]
+            exponent = min(max(a * (theta - difficulty[i]), -700.0), 700.0)
+            p = c + (1.0 - c) / (1.0 + math.exp(-exponent))
+            p = min(max(p, c), 1.0)
+            p = min(max(p, epsilon), 1.0 - epsilon)
+            pq = p * (1.0 - p)
+            residual = is_correct[i] - p
+            likelihood_derivative += a * residual * abs(residual) / pq
+            second_derivative -= a * a * pq
+        return likelihood_derivative, second_derivative
+
+    @njit(cache=True)
+    def _min_curvature(theta_a, theta_b, difficulty, discrimination, guessing, epsilon):
+        """Compiled version of _min_curvature_numpy"""
+        total = 0.0
+        for i in range(difficulty.shape[0]):
+            a = discrimination[i]
+            c = guessing[i]
+            weight = 1.0
+            for theta in (theta_a, theta_b):
+                theta = min(max(theta, -5.0), 5.0)
+                exponent = min(max(a * (theta - difficulty[i]), -700.0), 700.0)
+                p = c + (1.0 - c) / (1.0 + math.exp(-exponent))
+                p = min(max(p, c), 1.0)
+                p = min(max(p, epsilon), 1.0 - epsilon)
+                weight = min(weight, p * (1.0 - p))
+            total += a * a * weight
+        return total
+else:
+    _nr_derivatives = _nr_derivatives_numpy
+    _min_curvature = _min_curvature_numpy
+
+
+def _newton_raphson_loop_py(theta, is_correct, difficulty, discrimination, guessing, epsilon,
+                            iterations, max_change, march_direction, min_second_derivative,
+                            convergence_threshold, max_total_change, lower_bound, upper_bound):
+    """
+    Newton-Raphson iterations with the per-step, total-change and bounds limits.
+
+    Returns (theta, iterations_used, converged). With a non-zero march_direction
+    every step is taken as march_direction * max_change without evaluating
+    derivatives (see IRTEngine._identical_response_direction).
+    """
+    iterations_used = 0
+    total_change = 0.0
+    converged = False
+
+    for iteration in range(iterations):
+        iterations_used = iteration + 1
+
+        if march_direction != 0:
+            raw_delta_theta = march_direction * max_change
+        else:
+            likelihood_derivative, second_derivative = _nr_derivatives(
+                theta, is_correct, difficulty, discrimination, guessing, epsilon
+            )
+
+            if abs(second_derivative) < min_second_derivative:
+                break
+
+            raw_delta_theta = -likelihood_derivative / second_derivative
+
+            if abs(raw_delta_theta) < convergence_threshold:
+                converged = True
+                break
+
+        # Apply max change limits
+        delta_theta = raw_delta_theta
+        if abs(delta_theta) > max_change:
+            delta_theta = max_change if delta_theta > 0 else -max_change
+
+        # Check total change budget
+        potential_total_change = abs(total_change + delta_theta)
+        if potential_total_change > max_total_change:
+            remaining_budget = max_total_change - abs(total_change)
+            delta_theta = remaining_budget if delta_theta > 0 else -remaining_budget
+
+            if abs(delta_theta) < convergence_threshold:
+                break
+
+        new_theta = theta + delta_theta
+        total_change += delta_theta
+
+        # Apply bounds
+        bounded_theta = max(lower_bound, min(upper_bound, new_theta))
+        if bounded_theta != new_theta:
+            total_change = total_change - delta_theta + (bounded_theta - theta)
+
+        theta = bounded_theta
+
+        if abs(theta - (theta - delta_theta)) < convergence_threshold:
+            converged = True
+            break
+
+    return theta, iterations_used, converged
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath here: the limit checks rely on exact IEEE comparisons
+    _newton_raphson_loop = njit(cache=True)(_newton_raphson_loop_py)
+else:
+    _newton_raphson_loop = _newton_raphson_loop_py
+
+
+def _response_columns(responses: List[Tuple[bool, float, float, float]]
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split (is_correct, difficulty, discrimination, guessing) tuples into contiguous arrays.
+
+    Raises ValueError for non-finite values: the float conversion would otherwise
+    turn a missing (None) parameter into NaN and let it through silently.
+    """
+    if isinstance(responses, ResponseBatch):
+        # Batches check their values on append
+        return responses.is_correct, responses.b, responses.a, responses.g
+    if not responses:
+        columns = np.empty((4, 0))
+    else:
+        columns = np.array(responses, dtype=np.float64).T.copy()
+        if not np.isfinite(columns).all():
+            raise ValueError("Response values must be finite numbers")
+    return columns[0].astype(bool), columns[1], columns[2], columns[3]
+
+
+def _grid_probabilities(theta_grid: np.ndarray, responses: List[Tuple[bool, float, float, float]]
+                        ) -> Tuple[np.ndarray, np.ndarray]:
+    """is_correct and probability_correct for every (response, grid theta) pair, shape (responses, grid)"""
+    is_correct, difficulty, discrimination, guessing = _response_columns(responses)
+    p = _probability_vec(theta_grid, difficulty[:, None],
+                         np.clip(discrimination, 0.1, 3.0)[:, None], np.clip(guessing, 0.0, 0.4)[:, None])
+    return is_correct, p
+
+
+class ResponseBatch:
+    """
+    Responses stored as parallel arrays instead of a list of
+    (is_correct, difficulty, discrimination, guessing) tuples.
+
+    Backing buffers grow by doubling, so append is amortised O(1). The public
+    arrays are views over the filled prefix. Iterating or indexing yields the
+    legacy tuples, so a batch can be passed wherever a response list is expected.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self._is_correct = np.zeros(capacity, dtype=bool)
+        self._b = np.zeros(capacity)
+        self._a = np.zeros(capacity)
+        self._g = np.zeros(capacity)
+        self._size = 0
+
+    @classmethod
+    def from_responses(cls, responses) -> 'ResponseBatch':
+        """Wrap a response list (or return an existing batch unchanged)"""
+        if isinstance(responses, cls):
+            return responses
+        return cls._from_arrays(*_response_columns(responses))
+
+    @classmethod
+    def _from_arrays(cls, is_correct, b, a, g) -> 'ResponseBatch':
+        batch = cls.__new__(cls)
+        batch._is_correct, batch._b, batch._a, batch._g = is_correct, b, a, g
+        batch._size = len(b)
+        return batch
+
+    def append(self, response: Tuple[bool, float, float, float]) -> None:
+        """Append one (is_correct, difficulty, discrimination, guessing) tuple"""
+        if self._size == len(self._b):
+            self._grow()
+        n = self._size
+        self._is_correct[n], self._b[n], self._a[n], self._g[n] = response
+        if not (math.isfinite(self._b[n]) and math.isfinite(self._a[n]) and math.isfinite(self._g[n])):
+            raise ValueError("Response values must be finite numbers")
+        self._size = n + 1
+
+    def _grow(self):
+        capacity = max(16, 2 * len(self._b))
+        for name in ('_is_correct', '_b', '_a', '_g'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    @property
+    def is_correct(self) -> np.ndarray:
+        return self._is_correct[:self._size]
+
+    @property
+    def b(self) -> np.ndarray:
+        return self._b[:self._size]
+
+    @property
+    def a(self) -> np.ndarray:
+        return self._a[:self._size]
+
+    @property
+    def g(self) -> np.ndarray:
+        return self._g[:self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        for i in range(self._size):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ResponseBatch._from_arrays(self.is_correct[index], self.b[index],
+                                              self.a[index], self.g[index])
+        return (bool(self.is_correct[index]), float(self.b[index]),
+                float(self.a[index]), float(self.g[index]))
+
+
+class ResponseHistory:
+    """
+    Correct/incorrect flags for one assessment run, one byte per response in a
+    bytearray, plus a few running integers: the length of the trailing run of
+    identical responses, the longest correct and incorrect runs so far, and
+    the total number of correct responses.
+
+    The run lengths and whole-history counts are O(1); a window sum reads only
+    the last `window` bytes.
+    Indexing yields plain bools and slicing yields a list, so a history can be
+    passed wherever a List[bool] is expected.
+    """
+
+    def __init__(self):
+        self._flags = bytearray()
+        self._tail_run = 0
+        # Longest incorrect and correct run, indexed by flag
+        self._longest_runs = [0, 0]
+        self._correct_count = 0
+
+    def append(self, is_correct: bool) -> None:
+        flag = 1 if is_correct else 0
+        flags = self._flags
+        if flags and flags[-1] == flag:
+            self._tail_run += 1
+        else:
+            self._tail_run = 1
+        if self._tail_run > self._longest_runs[flag]:
+            self._longest_runs[flag] = self._tail_run
+        flags.append(flag)
+        self._correct_count += flag
+
+    @property
+    def flags(self) -> np.ndarray:
+        """Copy of the flags as a bool array"""
+        return np.frombuffer(self._flags, dtype=np.uint8).astype(bool)
+
+    @property
+    def tail_run(self) -> int:
+        """Length of the run of identical responses ending at the latest one"""
+        return self._tail_run
+
+    @property
+    def longest_runs(self) -> Tuple[int, int]:
+        """(longest correct run, longest incorrect run)"""
+        return self._longest_runs[1], self._longest_runs[0]
+
+    def window_sum(self, window: int) -> int:
+        """Correct responses among the last `window` (same as sum(history[-window:]))"""
+        if window == 0 or window >= len(self._flags):
+            # [-0:] slices the whole history
+            return self._correct_count
+        # Negative windows slice from the front, as with a list
+        return sum(self._flags[-window:])
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def __iter__(self):
+        return map(bool, self._flags)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [bool(flag) for flag in self._flags[index]]
+        return bool(self._flags[index])
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.flags, dtype=dtype)
+
+
+class QuestionBank:
+    """
+    Column view of a list of question dicts.
+
+    The IRT parameters are pulled out of the dicts once, and a mask of the
+    questions inside each tier's ranges is computed on first use and reused.
+    The columns are a snapshot taken when the bank is built: after questions
+    are added, removed or edited, build a new bank. A bank can be built once
+    and passed to run_adaptive_assessment for every simulated run over the
+    same items.
+    """
+
+    def __init__(self, questions: List[Dict]):
+        self.questions = questions
+        self.size = len(questions)
+        self.difficulty = np.fromiter((q.get('difficulty_b', 0.0) for q in questions),
+                                      dtype=np.float64, count=self.size)
+        self.discrimination = np.fromiter((q.get('discrimination_a', 1.0) for q in questions),
+                                          dtype=np.float64, count=self.size)
+        self.guessing = np.fromiter((q.get('guessing_c', 0.25) for q in questions),
+                                    dtype=np.float64, count=self.size)
+        self._tier_masks = {}
+        self._rows_by_id = None
+        self.all_have_ids = None
+        self._content_codes = None
+        self._content_areas = None
+
+        # Per-bank constants for information(): the clamped discrimination used
+        # inside the probability, and a^2 of the raw value used in the information
+        self._clipped_discrimination = np.clip(self.discrimination, 0.1, 3.0)
+        self._discrimination_sq = self.discrimination ** 2
+        # Banks usually share one guessing value; it is then folded into scalars
+        self._shared_guessing = None
+        if self.size and np.all(self.guessing == self.guessing[0]) and self.guessing[0] != 1.0:
+            self._shared_guessing = float(self.guessing[0])
+
+    def tier_mask(self, bounds: Tuple[float, float, float, float]) -> np.ndarray:
+        """
+        Boolean mask of questions inside a tier's ranges, given as
+        (difficulty_low, difficulty_high, discrimination_low, discrimination_high)
+        """
+        # Keyed on the bounds rather than the tier name, since engines with
+        # different tier configs may share a bank
+        mask = self._tier_masks.get(bounds)
+        if mask is None:
+            b_low, b_high, a_low, a_high = bounds
+            mask = ((self.difficulty >= b_low) & (self.difficulty <= b_high) &
+                    (self.discrimination >= a_low) & (self.discrimination <= a_high))
+            self._tier_masks[bounds] = mask
+        return mask
+
+    def _id_index(self) -> Dict[Any, List[int]]:
+        rows_by_id = self._rows_by_id
+        if rows_by_id is None:
+            # Ids are not guaranteed unique, so each id maps to all of its rows
+            rows_by_id = {}
+            for row, question in enumerate(self.questions):
+                rows_by_id.setdefault(question.get('id'), []).append(row)
+            self._rows_by_id = rows_by_id
+            self.all_have_ids = all('id' in question for question in self.questions)
+        return rows_by_id
+
+    def rows_with_ids(self, ids) -> np.ndarray:
+        """Boolean mask of questions whose 'id' is in `ids`"""
+        rows_by_id = self._id_index()
+        mask = np.zeros(self.size, dtype=bool)
+        for item_id in ids:
+            id_rows = rows_by_id.get(item_id)
+            if id_rows is not None:
+                mask[id_rows] = True
+        return mask
+
+    def counts_by_id(self, counts: Dict[Any, int]) -> Optional[np.ndarray]:
+        """
+        Per-question value of `counts` (keyed by question id, default 0).
+
+        Returns None when some question has no 'id', since callers key those
+        by str(question) instead.
+        """
+        rows_by_id = self._id_index()
+        if not self.all_have_ids:
+            return None
+        values = np.zeros(self.size, dtype=np.float64)
+        for item_id, count in counts.items():
+            id_rows = rows_by_id.get(item_id)
+            if id_rows is not None:
+                values[id_rows] = count
+        return values
+
+    def content_codes(self) -> Tuple[np.ndarray, List[str]]:
+        """Per-question index into the list of distinct content areas, in first-seen order"""
+        if self._content_codes is None:
+            area_codes = {}
+            self._content_codes = np.fromiter(
+                (area_codes.setdefault(q.get('content_area', 'default'), len(area_codes))
+                 for q in self.questions),
+                dtype=np.intp, count=self.size
+            )
+            self._content_areas = list(area_codes)
+        return self._content_codes, self._content_areas
+
+    def information(self, theta: float, rows: np.ndarray) -> np.ndarray:
+        """_information_vec at theta for the questions in `rows`, using the bank's precomputed columns"""
+        guessing = self._shared_guessing
+        if guessing is None:
+            return _information_vec(theta, self.difficulty[rows], self.discrimination[rows],
+                                    self.guessing[rows])
+
+        # Same operations and order as _probability_vec/_information_vec with the
+        # guessing terms as scalars, so results are identical
+        if theta > 5:
+            theta = 5.0
+        elif theta < -5:
+            theta = -5.0
+        clipped_guessing = max(0.0, min(0.4, guessing))
+        one_minus_guessing = 1 - guessing
+
+        exponent = self._clipped_discrimination[rows] * (theta - self.difficulty[rows])
+        np.clip(exponent, -700, 700, out=exponent)
+        probability = clipped_guessing + (1 - clipped_guessing) / (1 + np.exp(-exponent))
+        probability = np.minimum(np.maximum(probability, clipped_guessing), 1.0)
+
+        p_star = np.clip((probability - guessing) / one_minus_guessing, 1e-10, 1 - 1e-10)
+        info = np.minimum(100.0, self._discrimination_sq[rows] * (p_star * (1 - p_star))
+                          / one_minus_guessing ** 2)
+        return np.where((probability <= guessing) | (probability >= 1.0), 0.0, info)
+
+    def take(self, rows: np.ndarray) -> List[Dict]:
+        questions = self.questions
+        return [questions[i] for i in rows.tolist()]
+
+
+def _short_variance(values) -> float:
+    """
+    np.var of fewer than 8 floats without the array round trip.
+
+    NumPy sums that few elements sequentially, so accumulating in the same
+    order gives the identical result.
+    """
+    total = 0.0
+    for value in values:
+        total += value
+    mean = total / len(values)
+    squared_deviations = 0.0
+    for value in values:
+        deviation = value - mean
+        squared_deviations += deviation * deviation
+    return squared_deviations / len(values)
+
+
+def _recent_correct_count(response_history, window: int) -> int:
+    """sum(response_history[-window:]) without slicing a ResponseHistory"""
+    if isinstance(response_history, ResponseHistory):
+        return response_history.window_sum(window)
+    return sum(response_history[-window:])
+
+
+def _trailing_run(response_history) -> Tuple[bool, int]:
+    """Latest response and how many identical responses end the (non-empty) history"""
+    last_response = response_history[-1]
+    if isinstance(response_history, ResponseHistory):
+        return last_response, response_history.tail_run
+    run_length = 1
+    for i in range(len(response_history) - 2, -1, -1):
+        if response_history[i] != last_response:
+            break
+        run_length += 1
+    return last_response, run_length
+
 
 class TestPurpose(Enum):
     """Enum for different test purposes with specific configurations"""
@@ -51,7 +643,7 @@ class TestPurpose(Enum):
     FORMATIVE = "formative"  # For low-stakes, ongoing assessments
 
 
-@dataclass
+@dataclass(slots=True)
 class AdaptiveConfig:
     """Configuration class for different test purposes"""
     min_questions: int
@@ -111,6 +703,50 @@ class AdaptiveConfig:
         return configs.get(purpose, configs[TestPurpose.DIAGNOSTIC])
 
 
+# Pristine per-purpose configs for read-only lookups (the per-question stop check).
+# Engines keep taking fresh get_config() instances, since some callers mutate theirs.
+_PURPOSE_CONFIGS: Dict[Any, AdaptiveConfig] = {}
+
+
+def _purpose_config(purpose: TestPurpose) -> AdaptiveConfig:
+    """Shared AdaptiveConfig.get_config(purpose), built on first use; do not modify"""
+    config = _PURPOSE_CONFIGS.get(purpose)
+    if config is None:
+        config = _PURPOSE_CONFIGS[purpose] = AdaptiveConfig.get_config(purpose)
+    return config
+
+
+def _resolve_config_sections(config) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """(irt_config, tier_config) from any of the config formats IRTEngine accepts"""
+    if config is _DEFAULT_CONFIG:
+        # Engines built without a config: skip the format probing
+        return _DEFAULT_CONFIG['irt_config'], _DEFAULT_CONFIG['tier_config']
+
+    # Handle different config formats
+    if isinstance(config, dict):
+        if 'irt_config' in config and 'tier_config' in config:
+            irt_config = config['irt_config']
+            tier_config = config['tier_config']
+        elif 'get_irt_config' in config and 'get_tier_config' in config:
+            irt_config = config['get_irt_config']() if callable(config['get_irt_config']) else config['get_irt_config']
+            tier_config = config['get_tier_config']() if callable(config['get_tier_config']) else config['get_tier_config']
+        else:
+            irt_config = config
+            tier_config = _DEFAULT_CONFIG['tier_config']
+    else:
+        try:
+            irt_config = config.get_irt_config()
+            tier_config = config.get_tier_config()
+        except AttributeError:
+            if hasattr(config, 'irt_config'):
+                irt_config = config.irt_config
+                tier_config = config.tier_config if hasattr(config, 'tier_config') else _DEFAULT_CONFIG['tier_config']
+            else:
+                raise ValueError("Config must be a dict with 'irt_config' and 'tier_config' keys")
+
+    return irt_config, tier_config
+
+
 class IRTEngine:
     """
     Production-ready IRT engine with sliding window adaptive updates.
@@ -128,9 +764,31 @@ class IRTEngine:
     - Sliding window: Recent performance weighted appropriately
     """
 
+    # Every attribute is assigned in __init__; no per-engine __dict__
+    __slots__ = (
+        'config', 'test_purpose', 'adaptive_config',
+        'current_theta', 'theta_velocity', 'velocity_damping',
+        'target_sem', 'max_questions', 'min_questions',
+        'history_window', 'max_theta_change', 'theta_jump', 'consecutive_same_responses',
+        'theta_bounds', 'newton_raphson_iterations', 'convergence_threshold',
+        'base_exponential_smoothing_alpha', 'exponential_smoothing_alpha', 'enable_consecutive_jumps',
+        'use_windowed_theta', 'response_window_size', 'window_transition_start', 'window_transition_end',
+        'tier_promotion_window', 'tier_promotion_threshold', 'tier_demotion_window',
+        'tier_demotion_threshold', 'min_questions_before_tier_change',
+        'tier_theta_ranges', 'tier_discrimination_ranges', 'tier_difficulty_ranges',
+        'initial_theta_map', '_tier_filter_bounds',
+        'ABSOLUTE_MAX_TOTAL_CHANGE', 'MIN_SECOND_DERIVATIVE', 'MAX_SINGLE_STEP', 'PROBABILITY_EPSILON',
+        '_eap_theta_grid', '_eap_log_prior', '_mle_theta_grid',
+        'EARLY_QUESTIONS_COUNT', 'EARLY_QUESTIONS_MAX_CHANGE',
+        'used_content_areas',
+        'response_times', 'question_response_times', '_rt_weight_memo', 'theta_history', 'cumulative_responses',
+        'last_question_difficulty', 'item_exposure_counts',
+        'max_item_exposure_rate', 'asked_question_ids',
+    )
+
     def __init__(self, config=None, test_purpose: TestPurpose = TestPurpose.DIAGNOSTIC):
         if config is None:
-            config = get_default_config()
+            config = _DEFAULT_CONFIG
 
         self.config = config
         self.test_purpose = test_purpose
@@ -140,27 +798,7 @@ class IRTEngine:
         self.theta_velocity = 0.0
         self.velocity_damping = 0.5
 
-        # Handle different config formats
-        if isinstance(config, dict):
-            if 'irt_config' in config and 'tier_config' in config:
-                irt_config = config['irt_config']
-                tier_config = config['tier_config']
-            elif 'get_irt_config' in config and 'get_tier_config' in config:
-                irt_config = config['get_irt_config']() if callable(config['get_irt_config']) else config['get_irt_config']
-                tier_config = config['get_tier_config']() if callable(config['get_tier_config']) else config['get_tier_config']
-            else:
-                irt_config = config
-                tier_config = get_default_config()['tier_config']
-        else:
-            try:
-                irt_config = config.get_irt_config()
-                tier_config = config.get_tier_config()
-            except AttributeError:
-                if hasattr(config, 'irt_config'):
-                    irt_config = config.irt_config
-                    tier_config = config.tier_config if hasattr(config, 'tier_config') else get_default_config()['tier_config']
-                else:
-                    raise ValueError("Config must be a dict with 'irt_config' and 'tier_config' keys")
+        irt_config, tier_config = _resolve_config_sections(config)
 
         # Load configuration values from AdaptiveConfig
         self.target_sem = self.adaptive_config.target_sem
@@ -196,6 +834,13 @@ class IRTEngine:
         self.tier_discrimination_ranges = tier_config["discrimination_ranges"]
         self.tier_difficulty_ranges = tier_config["difficulty_ranges"]
         self.initial_theta_map = tier_config["initial_theta_map"]
+        # Flat (b_low, b_high, a_low, a_high) per tier for QuestionBank.tier_mask
+        self._tier_filter_bounds = {
+            tier: (float(b_range[0]), float(b_range[1]),
+                   float(self.tier_discrimination_ranges[tier][0]),
+                   float(self.tier_discrimination_ranges[tier][1]))
+            for tier, b_range in self.tier_difficulty_ranges.items()
+        }
 
         # Newton-Raphson safety constants
         self.ABSOLUTE_MAX_TOTAL_CHANGE = 1.0
@@ -203,20 +848,23 @@ class IRTEngine:
         self.MAX_SINGLE_STEP = 0.5
         self.PROBABILITY_EPSILON = 1e-4
 
+        # Fallback estimator grids (read-only, built once per engine)
+        self._eap_theta_grid = np.linspace(self.theta_bounds[0], self.theta_bounds[1], 100)
+        self._eap_log_prior = -0.5 * self._eap_theta_grid ** 2
+        self._mle_theta_grid = np.linspace(self.theta_bounds[0], self.theta_bounds[1], 200)
+
         # CONTRACT: Early questions protection
         self.EARLY_QUESTIONS_COUNT = 5
         self.EARLY_QUESTIONS_MAX_CHANGE = 0.2
 
-        # Performance optimization
-        self._information_cache = {}
-        self._probability_cache = {}
-
         # Content balancing tracking
         self.used_content_areas = {}
 
         # Response time tracking
         self.response_times = []
         self.question_response_times = []
+        # (response_time, max(log(response_time + 1), 0.1)) for the last RT weighted
+        self._rt_weight_memo = (None, 1.0)
 
         # Theta history for stability analysis
         self.theta_history = []
@@ -263,22 +911,19 @@ class IRTEngine:
 
     def theta_to_tier(self, theta: float) -> str:
         """Convert theta to tier"""
-        if theta < -1.0:
-            return "C1"
-        elif theta < 0.0:
-            return "C2"
-        elif theta < 1.0:
-            return "C3"
-        else:
-            return "C4"
+        # bisect_right counts edges <= theta, so boundaries fall into the upper tier
+        # (and NaN lands in C4, as with the original comparison chain)
+        return _TIER_LABELS[bisect_right(_TIER_THETA_EDGES, theta)]
+
+    def tier_history(self) -> np.ndarray:
+        """Tier of every theta in theta_history, as theta_to_tier would map each one"""
+        # side='right' matches bisect_right, NaN included (sorted past every edge -> C4)
+        indices = np.searchsorted(_TIER_THETA_EDGE_ARRAY, self.theta_history, side='right')
+        return _TIER_LABEL_ARRAY[indices]
 
     def get_tier_index(self, tier: str) -> int:
         """Get tier index for boundary calculations"""
-        tier_order = ["C1", "C2", "C3", "C4"]
-        try:
-            return tier_order.index(tier)
-        except ValueError:
-            return 0
+        return _TIER_INDEX.get(tier, 0)
 
     def get_current_tiers(self, theta: float, response_history: List[bool]) -> Dict[str, str]:
         """
@@ -291,9 +936,8 @@ class IRTEngine:
 
         # Get active tier if we have enough questions
         if len(response_history) >= self.min_questions_before_tier_change:
-            consecutive_info = self.detect_consecutive_responses(response_history)
             active_tier = self._apply_conservative_fairness_constraints(
-                estimated_tier, response_history, consecutive_info
+                estimated_tier, response_history
             )
         else:
             # Before min questions, active tier is initial tier
@@ -312,47 +956,27 @@ class IRTEngine:
             'tier_note': tier_note
         }
 
-    @lru_cache(maxsize=1000)
     def cached_probability_correct(self, theta: float, difficulty: float,
                                    discrimination: float, guessing: float = 0.25) -> float:
-        """Cached version of probability calculation for performance"""
-        return self.probability_correct(theta, difficulty, discrimination, guessing)
+        """
+        Kept for existing callers. Newton-Raphson works on whole response arrays, and
+        the scalar 3PL is cheaper than hashing its arguments, so nothing is cached.
+        """
+        return _probability_3pl(theta, difficulty, discrimination, guessing)
 
     def probability_correct(self, theta: float, difficulty: float,
                             discrimination: float, guessing: float = 0.25) -> float:
         """Calculate probability of correct response using 3PL model"""
-        try:
-            theta = max(-5, min(5, theta))
-            discrimination = max(0.1, min(3.0, discrimination))
-            guessing = max(0, min(0.4, guessing))
-
-            exponent = discrimination * (theta - difficulty)
-
-            if exponent > 700:
-                return 1.0
-            elif exponent < -700:
-                return guessing
-            else:
-                exp_term = math.exp(-exponent)
-                probability = guessing + (1 - guessing) / (1 + exp_term)
-                return max(guessing, min(1.0, probability))
-
-        except (OverflowError, ZeroDivisionError, ValueError) as e:
-            logger.warning(f"Error in probability calculation: {e}")
-            return 0.5
+        return _probability_3pl(theta, difficulty, discrimination, guessing)
 
     def information(self, theta: float, difficulty: float,
                     discrimination: float, guessing: float = 0.25) -> float:
-        """Calculate Fisher Information with caching"""
-        cache_key = (round(theta, 3), round(difficulty, 3),
-                     round(discrimination, 3), round(guessing, 3))
-
-        if cache_key in self._information_cache:
-            return self._information_cache[cache_key]
-
+        """Calculate Fisher Information"""
         p = self.probability_correct(theta, difficulty, discrimination, guessing)
 
-        if p <= guessing or p >= 1.0:
+        if guessing == _DEFAULT_GUESSING:
+            info_value = _info_3pl_c025(p, discrimination)
+        elif p <= guessing or p >= 1.0:
             info_value = 0.0
         else:
             try:
@@ -368,7 +992,6 @@ class IRTEngine:
                 logger.warning(f"Error in information calculation: {e}")
                 info_value = 0.0
 
-        self._information_cache[cache_key] = info_value
         return info_value
 
     def rt_weighted_information(self, theta: float, difficulty: float,
@@ -386,13 +1009,25 @@ class IRTEngine:
         if response_time is None or response_time <= 0:
             return base_information
 
-        rt_weight = math.log(response_time + 1)
-        rt_weight = max(rt_weight, 0.1)
-
-        weighted_info = base_information / rt_weight
+        weighted_info = base_information / self._response_time_weight(response_time)
 
         return weighted_info
 
+    def _response_time_weight(self, response_time: float) -> float:
+        """max(log(RT + 1), 0.1), reusing the last result while the RT is unchanged"""
+        cached_time, cached_weight = self._rt_weight_memo
+        if response_time == cached_time:
+            return cached_weight
+        weight = max(math.log(response_time + 1), 0.1)
+        self._rt_weight_memo = (response_time, weight)
+        return weight
+
+    def record_response_time(self, response_time: float):
+        """Append a question response time and precompute its information weight"""
+        self.question_response_times.append(response_time)
+        if response_time is not None and response_time > 0:
+            self._response_time_weight(response_time)
+
     def adaptive_theta_jump_size(self, consecutive_count: int,
                                  response_type: str, questions_answered: int) -> float:
         """Dynamic jump size with early assessment protection"""
@@ -423,19 +1058,11 @@ class IRTEngine:
                 'jump_size': 0.0
             }
 
-        recent_responses = response_history[-self.consecutive_same_responses:]
-        all_correct = all(recent_responses)
-        all_incorrect = all(not r for r in recent_responses)
-
-        if all_correct or all_incorrect:
-            consecutive_count = self.consecutive_same_responses
-            response_type = 'correct' if all_correct else 'incorrect'
+        last_response, run_length = _trailing_run(response_history)
 
-            for i in range(len(response_history) - self.consecutive_same_responses - 1, -1, -1):
-                if response_history[i] == recent_responses[0]:
-                    consecutive_count += 1
-                else:
-                    break
+        if run_length >= self.consecutive_same_responses:
+            consecutive_count = run_length
+            response_type = 'correct' if last_response else 'incorrect'
 
             questions_answered = len(response_history)
             jump_size = self.adaptive_theta_jump_size(consecutive_count, response_type, questions_answered)
@@ -471,8 +1098,7 @@ class IRTEngine:
             max_real_change = self.max_theta_change
 
         lookback = min(3, len(response_history))
-        recent_responses = response_history[-lookback:]
-        correct_count = sum(recent_responses)
+        correct_count = _recent_correct_count(response_history, lookback)
 
         multiplier = self.adaptive_config.anticipation_multiplier
 
@@ -489,25 +1115,26 @@ class IRTEngine:
 
         anticipated_theta = current_theta + anticipated_adjustment
 
-        anticipated_theta = max(self.theta_bounds[0],
-                                min(self.theta_bounds[1], anticipated_theta))
+        lower_bound, upper_bound = self.theta_bounds
+        anticipated_theta = anticipated_theta if anticipated_theta < upper_bound else upper_bound
+        anticipated_theta = anticipated_theta if anticipated_theta > lower_bound else lower_bound
 
-        current_tier_idx = self.get_tier_index(self.theta_to_tier(current_theta))
-        anticipated_tier_idx = self.get_tier_index(self.theta_to_tier(anticipated_theta))
+        # Tier indices straight from the bins, same as get_tier_index(theta_to_tier(...))
+        current_tier_idx = bisect_right(_TIER_THETA_EDGES, current_theta)
+        anticipated_tier_idx = bisect_right(_TIER_THETA_EDGES, anticipated_theta)
 
         if abs(anticipated_tier_idx - current_tier_idx) > 1:
-            tier_boundaries = [-3.0, -1.0, 0.0, 1.0, 3.0]
             if anticipated_tier_idx > current_tier_idx:
-                anticipated_theta = tier_boundaries[current_tier_idx + 1] + 0.1
+                anticipated_theta = _TIER_BOUNDARIES[current_tier_idx + 1] + 0.1
             else:
-                anticipated_theta = tier_boundaries[current_tier_idx] - 0.1
+                anticipated_theta = _TIER_BOUNDARIES[current_tier_idx] - 0.1
 
-            logger.debug(f"Tier crossing clamped: {current_tier_idx} -> {anticipated_tier_idx}, "
-                         f"theta clamped to {anticipated_theta:.3f}")
+            logger.debug("Tier crossing clamped: %s -> %s, theta clamped to %.3f",
+                         current_tier_idx, anticipated_tier_idx, anticipated_theta)
 
-        logger.debug(f"Anticipated theta: {current_theta:.3f} -> {anticipated_theta:.3f} "
-                     f"(delta={anticipated_adjustment:+.3f}, pattern={correct_count}/{lookback}, "
-                     f"multiplier={multiplier}x)")
+        logger.debug("Anticipated theta: %.3f -> %.3f (delta=%+.3f, pattern=%s/%s, multiplier=%sx)",
+                     current_theta, anticipated_theta, anticipated_adjustment,
+                     correct_count, lookback, multiplier)
 
         return anticipated_theta
 
@@ -521,49 +1148,56 @@ class IRTEngine:
         return True
 
     def select_next_question_with_content_balance(self, theta: float,
-                                                  available_questions: List[Dict],
+                                                  available_questions: Union[List[Dict], 'QuestionBank'],
                                                   response_history: List[bool],
                                                   questions_answered: int = 0) -> Optional[Dict]:
         """
         Select next question with calibrated anticipation and proper difficulty progression.
         """
-        if not available_questions:
+        bank = self._bank_for(available_questions)
+        row = self._select_row_with_content_balance(
+            theta, bank, np.arange(bank.size), response_history, questions_answered
+        )
+        return bank.questions[row] if row is not None else None
+
+    def _select_row_with_content_balance(self, theta: float, bank: 'QuestionBank',
+                                         rows: np.ndarray, response_history: List[bool],
+                                         questions_answered: int = 0) -> Optional[int]:
+        """Content-balanced selection over the given bank rows; returns the chosen row"""
+        if len(rows) == 0:
             return None
 
         current_tier = self.theta_to_tier(theta)
-        consecutive_info = self.detect_consecutive_responses(response_history)
 
         anticipated_theta = self.calculate_anticipated_theta(
             theta, response_history, questions_answered
         )
 
         adjusted_tier = self._apply_conservative_fairness_constraints(
-            current_tier, response_history, consecutive_info
+            current_tier, response_history
         )
 
         anticipated_tier = self.theta_to_tier(anticipated_theta)
         selection_tier = anticipated_tier if anticipated_tier != current_tier else adjusted_tier
 
-        logger.debug(f"Question selection: current_theta={theta:.3f}, "
-                     f"anticipated_theta={anticipated_theta:.3f}, "
-                     f"current_tier={current_tier}, selection_tier={selection_tier}")
+        logger.debug("Question selection: current_theta=%.3f, anticipated_theta=%.3f, "
+                     "current_tier=%s, selection_tier=%s",
+                     theta, anticipated_theta, current_tier, selection_tier)
 
-        suitable_questions = self._filter_questions_by_tier(available_questions, selection_tier)
-        if not suitable_questions:
-            suitable_questions = self._filter_questions_by_tier(available_questions, adjusted_tier)
-            if not suitable_questions:
-                suitable_questions = available_questions
-                logger.warning(f"No tier-appropriate questions, using all {len(available_questions)}")
+        suitable_rows = self._rows_in_tier(bank, rows, selection_tier)
+        if len(suitable_rows) == 0:
+            suitable_rows = self._rows_in_tier(bank, rows, adjusted_tier)
+            if len(suitable_rows) == 0:
+                suitable_rows = rows
+                logger.warning(f"No tier-appropriate questions, using all {len(rows)}")
 
         # CONTRACT: Prevent question repetition
         if self.asked_question_ids:
-            suitable_questions = [q for q in suitable_questions
-                                 if q.get('id') not in self.asked_question_ids]
-            if not suitable_questions:
+            suitable_rows = self._rows_not_asked(bank, suitable_rows)
+            if len(suitable_rows) == 0:
                 logger.warning("All tier-appropriate questions already asked, expanding to all tiers")
-                suitable_questions = [q for q in available_questions
-                                    if q.get('id') not in self.asked_question_ids]
-                if not suitable_questions:
+                suitable_rows = self._rows_not_asked(bank, rows)
+                if len(suitable_rows) == 0:
                     logger.error("All questions in bank have been asked!")
                     return None
 
@@ -571,107 +1205,104 @@ class IRTEngine:
         if (len(response_history) >= 1 and response_history[-1] and
                 self.last_question_difficulty is not None):
             min_difficulty = self.last_question_difficulty
-            filtered = [q for q in suitable_questions
-                        if q['difficulty_b'] >= min_difficulty]
+            # Gathered once; the relaxed threshold below reuses it
+            candidate_difficulty = bank.difficulty[suitable_rows]
+            filtered = suitable_rows[candidate_difficulty >= min_difficulty]
 
-            if filtered:
-                suitable_questions = filtered
-                logger.debug(f"Applied STRICT min difficulty constraint: {min_difficulty:.3f}")
+            if len(filtered):
+                suitable_rows = filtered
+                logger.debug("Applied STRICT min difficulty constraint: %.3f", min_difficulty)
             else:
                 min_difficulty_relaxed = self.last_question_difficulty - 0.05
-                filtered = [q for q in suitable_questions
-                           if q['difficulty_b'] >= min_difficulty_relaxed]
-                if filtered:
-                    suitable_questions = filtered
+                filtered = suitable_rows[candidate_difficulty >= min_difficulty_relaxed]
+                if len(filtered):
+                    suitable_rows = filtered
                     logger.warning(f"Relaxed difficulty constraint to {min_difficulty_relaxed:.3f}")
                 else:
                     logger.warning("STRICT difficulty constraint too restrictive, using all suitable questions")
 
-        question_scores = []
-        for question in suitable_questions:
-            if (self.adaptive_config.enable_rt_weighted_information and
-                    self.question_response_times):
-                recent_rt = self.question_response_times[-1] if self.question_response_times else 15.0
-                info = self.rt_weighted_information(
-                    anticipated_theta,
-                    question['difficulty_b'],
-                    question['discrimination_a'],
-                    question['guessing_c'],
-                    recent_rt
-                )
-            else:
-                info = self.information(
-                    anticipated_theta,
-                    question['difficulty_b'],
-                    question['discrimination_a'],
-                    question['guessing_c']
-                )
-
-            if self.adaptive_config.enable_content_balancing:
-                content_area = question.get('content_area', 'default')
-                usage_count = self.used_content_areas.get(content_area, 0)
-                content_penalty = 1.0 - (0.1 * min(usage_count, 5))
-            else:
-                content_penalty = 1.0
-
-            item_id = question.get('id', str(question))
-            exposure_count = self.item_exposure_counts.get(item_id, 0)
-            exposure_penalty = 1.0 - (0.2 * min(exposure_count, 3))
-
-            difficulty_progression_bonus = 1.0
-            if (len(response_history) >= 1 and response_history[-1] and
-                    self.last_question_difficulty is not None):
-                if question['difficulty_b'] > self.last_question_difficulty + 0.05:
-                    difficulty_progression_bonus = 1.2
-                elif question['difficulty_b'] >= self.last_question_difficulty - 0.05:
-                    difficulty_progression_bonus = 1.1
+        candidate_information = self._candidate_information(anticipated_theta, bank, suitable_rows)
+        if (self.adaptive_config.enable_rt_weighted_information and
+                self.question_response_times):
+            # Same I(theta) / log(RT + 1) weighting as rt_weighted_information, applied to all candidates
+            recent_rt = self.question_response_times[-1]
+            if recent_rt is not None and recent_rt > 0:
+                candidate_information = candidate_information / self._response_time_weight(recent_rt)
 
-            adjusted_score = info * content_penalty * exposure_penalty * difficulty_progression_bonus
-            difficulty_distance = abs(question['difficulty_b'] - anticipated_theta)
-
-            question_scores.append({
-                'question': question,
-                'adjusted_score': adjusted_score,
-                'raw_information': info,
-                'difficulty_distance': difficulty_distance,
-                'content_penalty': content_penalty,
-                'exposure_penalty': exposure_penalty,
-                'progression_bonus': difficulty_progression_bonus
-            })
-
-        if question_scores:
-            question_scores.sort(key=lambda x: x['adjusted_score'], reverse=True)
-
-            best_item = question_scores[0]
-            best_question = best_item['question']
-
-            content_area = best_question.get('content_area', 'default')
-            self.used_content_areas[content_area] = self.used_content_areas.get(content_area, 0) + 1
-
-            item_id = best_question.get('id', str(best_question))
-            self.item_exposure_counts[item_id] = self.item_exposure_counts.get(item_id, 0) + 1
-
-            self.last_question_difficulty = best_question['difficulty_b']
-
-            # CONTRACT: Mark question as asked to prevent repetition
-            self.asked_question_ids.add(item_id)
-            logger.debug(f"Question {item_id} marked as asked (total asked: {len(self.asked_question_ids)})")
-
-            logger.info(f"Selected Q{questions_answered + 1}: "
-                        f"diff={best_question['difficulty_b']:.3f}, "
-                        f"disc={best_question['discrimination_a']:.3f}, "
-                        f"info={best_item['raw_information']:.3f}, "
-                        f"score={best_item['adjusted_score']:.3f}, "
-                        f"prog_bonus={best_item['progression_bonus']:.2f}")
+        # Every factor of the score is a vector over suitable_rows; argmax keeps the
+        # first of equal scores, so ties still go to the earliest candidate
+        if self.adaptive_config.enable_content_balancing:
+            content_penalty = self._content_penalties(bank, suitable_rows)
+        else:
+            content_penalty = 1.0
+        exposure_penalty = self._exposure_penalties(bank, suitable_rows)
 
-            return best_question
+        difficulty_progression_bonus = np.ones(len(suitable_rows))
+        if (len(response_history) >= 1 and response_history[-1] and
+                self.last_question_difficulty is not None):
+            candidate_difficulty = bank.difficulty[suitable_rows]
+            difficulty_progression_bonus = np.where(
+                candidate_difficulty > self.last_question_difficulty + 0.05, 1.2,
+                np.where(candidate_difficulty >= self.last_question_difficulty - 0.05, 1.1, 1.0)
+            )
 
-        return None
+        adjusted_scores = (candidate_information * content_penalty * exposure_penalty
+                           * difficulty_progression_bonus)
+        best = int(np.argmax(adjusted_scores))
+        best_row = int(suitable_rows[best])
+        best_question = bank.questions[best_row]
+
+        content_area = best_question.get('content_area', 'default')
+        self.used_content_areas[content_area] = self.used_content_areas.get(content_area, 0) + 1
+
+        item_id = best_question.get('id', str(best_question))
+        self.item_exposure_counts[item_id] = self.item_exposure_counts.get(item_id, 0) + 1
+
+        self.last_question_difficulty = best_question['difficulty_b']
+
+        # CONTRACT: Mark question as asked to prevent repetition
+        self.asked_question_ids.add(item_id)
+        logger.debug("Question %s marked as asked (total asked: %d)", item_id, len(self.asked_question_ids))
+
+        logger.info("Selected Q%d: diff=%.3f, disc=%.3f, info=%.3f, score=%.3f, prog_bonus=%.2f",
+                    questions_answered + 1, best_question['difficulty_b'],
+                    best_question['discrimination_a'], candidate_information[best],
+                    adjusted_scores[best], difficulty_progression_bonus[best])
+
+        return best_row
+
+    def _content_penalties(self, bank: 'QuestionBank', rows: np.ndarray) -> np.ndarray:
+        """1 - 0.1 * min(uses of the question's content area, 5) for each row"""
+        codes, areas = bank.content_codes()
+        used = self.used_content_areas
+        usage = np.fromiter((used.get(area, 0) for area in areas), dtype=np.float64, count=len(areas))
+        return (1.0 - (0.1 * np.minimum(usage, 5)))[codes[rows]]
+
+    def _exposure_penalties(self, bank: 'QuestionBank', rows: np.ndarray) -> np.ndarray:
+        """1 - 0.2 * min(times the question was selected, 3) for each row"""
+        exposure = self.item_exposure_counts
+        if not exposure:
+            return np.ones(len(rows))
+        counts = bank.counts_by_id(exposure)
+        if counts is None:
+            questions = bank.questions
+            counts = np.fromiter((exposure.get(questions[i].get('id', str(questions[i])), 0)
+                                  for i in rows.tolist()), dtype=np.float64, count=len(rows))
+        else:
+            counts = counts[rows]
+        return 1.0 - (0.2 * np.minimum(counts, 3))
 
-    def select_next_question(self, theta: float, available_questions: List[Dict],
+    def select_next_question(self, theta: float,
+                             available_questions: Union[List[Dict], 'QuestionBank'],
                              response_history: List[bool],
                              questions_answered: int = 0) -> Optional[Dict]:
-        """Main question selection method"""
+        """
+        Main question selection method.
+
+        `available_questions` may also be a QuestionBank built once over the whole
+        item pool; questions already asked are then skipped via asked_question_ids,
+        so the pool does not have to be rebuilt after every selection.
+        """
         if self.adaptive_config.enable_content_balancing:
             return self.select_next_question_with_content_balance(
                 theta, available_questions, response_history, questions_answered
@@ -681,41 +1312,59 @@ class IRTEngine:
                 theta, available_questions, response_history, questions_answered
             )
 
-    def _select_next_question_original(self, theta: float, available_questions: List[Dict],
+    def _select_next_row(self, theta: float, bank: 'QuestionBank', rows: np.ndarray,
+                         response_history: List[bool],
+                         questions_answered: int = 0) -> Optional[int]:
+        """select_next_question over bank rows; returns the chosen row instead of the dict"""
+        if self.adaptive_config.enable_content_balancing:
+            return self._select_row_with_content_balance(
+                theta, bank, rows, response_history, questions_answered
+            )
+        else:
+            return self._select_row_original(
+                theta, bank, rows, response_history, questions_answered
+            )
+
+    def _select_next_question_original(self, theta: float,
+                                       available_questions: Union[List[Dict], 'QuestionBank'],
                                        response_history: List[bool],
                                        questions_answered: int = 0) -> Optional[Dict]:
         """Original question selection logic with anticipated theta and constraints"""
-        if not available_questions:
+        bank = self._bank_for(available_questions)
+        row = self._select_row_original(
+            theta, bank, np.arange(bank.size), response_history, questions_answered
+        )
+        return bank.questions[row] if row is not None else None
+
+    def _select_row_original(self, theta: float, bank: 'QuestionBank', rows: np.ndarray,
+                             response_history: List[bool],
+                             questions_answered: int = 0) -> Optional[int]:
+        """Original selection over the given bank rows; returns the chosen row"""
+        if len(rows) == 0:
             return None
 
         current_tier = self.theta_to_tier(theta)
-        consecutive_info = self.detect_consecutive_responses(response_history)
 
         anticipated_theta = self.calculate_anticipated_theta(
             theta, response_history, questions_answered
         )
 
         adjusted_tier = self._apply_conservative_fairness_constraints(
-            current_tier, response_history, consecutive_info
+            current_tier, response_history
         )
 
-        suitable_questions = self._filter_questions_by_tier(
-            available_questions,
-            self.theta_to_tier(anticipated_theta)
-        )
-        if not suitable_questions:
-            suitable_questions = self._filter_questions_by_tier(available_questions, adjusted_tier)
-            if not suitable_questions:
-                suitable_questions = available_questions
+        suitable_rows = self._rows_in_tier(bank, rows, self.theta_to_tier(anticipated_theta))
+        if len(suitable_rows) == 0:
+            suitable_rows = self._rows_in_tier(bank, rows, adjusted_tier)
+            if len(suitable_rows) == 0:
+                suitable_rows = rows
 
         # CONTRACT: Prevent question repetition
         if self.asked_question_ids:
-            suitable_questions = [q for q in suitable_questions
-                                 if q.get('id') not in self.asked_question_ids]
-            if not suitable_questions:
-                suitable_questions = [q for q in available_questions
-                                    if q.get('id') not in self.asked_question_ids]
-                if not suitable_questions:
+            suitable_rows = self._rows_not_asked(bank, suitable_rows)
+            if len(suitable_rows) == 0:
+                suitable_rows = self._rows_not_asked(bank, rows)
+                if len(suitable_rows) == 0:
                     logger.error("All questions already asked!")
                     return None
 
@@ -723,35 +1372,36 @@ class IRTEngine:
         if (len(response_history) >= 1 and response_history[-1] and
                 self.last_question_difficulty is not None):
             min_difficulty = self.last_question_difficulty
-            filtered = [q for q in suitable_questions if q['difficulty_b'] >= min_difficulty]
-            if filtered:
-                suitable_questions = filtered
-                logger.debug(f"Applied STRICT min difficulty constraint: {min_difficulty:.3f}")
+            # Gathered once; the relaxed threshold below reuses it
+            candidate_difficulty = bank.difficulty[suitable_rows]
+            filtered = suitable_rows[candidate_difficulty >= min_difficulty]
+            if len(filtered):
+                suitable_rows = filtered
+                logger.debug("Applied STRICT min difficulty constraint: %.3f", min_difficulty)
             else:
                 min_difficulty_relaxed = self.last_question_difficulty - 0.05
-                filtered = [q for q in suitable_questions if q['difficulty_b'] >= min_difficulty_relaxed]
-                if filtered:
-                    suitable_questions = filtered
+                filtered = suitable_rows[candidate_difficulty >= min_difficulty_relaxed]
+                if len(filtered):
+                    suitable_rows = filtered
                     logger.warning(f"Relaxed difficulty constraint to {min_difficulty_relaxed:.3f}")
 
-        best_question = None
-        max_information = -1
-        best_difficulty_distance = float('inf')
-
-        for question in suitable_questions:
-            info = self.information(
-                anticipated_theta,
-                question['difficulty_b'],
-                question['discrimination_a'],
-                question['guessing_c']
-            )
-
-            difficulty_distance = abs(question['difficulty_b'] - anticipated_theta)
+        candidate_information = self._candidate_information(anticipated_theta, bank, suitable_rows)
 
-            if info > max_information or (info == max_information and difficulty_distance < best_difficulty_distance):
-                max_information = info
-                best_question = question
-                best_difficulty_distance = difficulty_distance
+        # Most informative question; among equally informative ones the first with the
+        # difficulty closest to anticipated theta. fmax skips NaN, as the comparisons did.
+        if len(candidate_information) == 0:
+            return None
+        max_information = float(np.fmax.reduce(candidate_information))
+        if not max_information > -1:
+            return None
+        tied = np.flatnonzero(candidate_information == max_information)
+        if len(tied) > 1:
+            tied_distance = np.abs(bank.difficulty[suitable_rows[tied]] - anticipated_theta)
+            best = int(tied[np.argmin(tied_distance)])
+        else:
+            best = int(tied[0])
+        best_row = int(suitable_rows[best])
+        best_question = bank.questions[best_row]
 
         if best_question:
             self.last_question_difficulty = best_question['difficulty_b']
@@ -760,13 +1410,45 @@ class IRTEngine:
             item_id = best_question.get('id')
             if item_id:
                 self.asked_question_ids.add(item_id)
-                logger.debug(f"Question {item_id} marked as asked (total asked: {len(self.asked_question_ids)})")
+                logger.debug("Question %s marked as asked (total asked: %d)", item_id, len(self.asked_question_ids))
+
+            logger.info("Selected Q%d: diff=%.3f, info=%.3f",
+                        questions_answered + 1, best_question['difficulty_b'], max_information)
 
-            logger.info(f"Selected Q{questions_answered + 1}: "
-                        f"diff={best_question['difficulty_b']:.3f}, "
-                        f"info={max_information:.3f}")
+        return best_row
 
-        return best_question
+    def _identical_response_direction(self, current_theta: float, is_correct: np.ndarray,
+                                      difficulties: np.ndarray, discriminations: np.ndarray,
+                                      guessings: np.ndarray, max_change: float) -> int:
+        """
+        +1 / -1 if every response is correct / incorrect and each Newton step is
+        guaranteed to be clipped to max_change; 0 if the loop has to run normally.
+
+        With identical responses each item's share of |d1 / d2| is 1/(a p^2) or
+        1/(a q^2), so the raw step never drops below 1/max(a) and is always clipped
+        once max_change and the convergence threshold sit under that. The small-d2
+        exit cannot fire while sum(a^2 p q) stays above MIN_SECOND_DERIVATIVE, and
+        p*q is unimodal in theta, so checking both ends of the reachable range is enough.
+        """
+        if is_correct.all():
+            direction = 1
+        elif not is_correct.any():
+            direction = -1
+        else:
+            return 0
+
+        min_raw_step = 0.99 / float(discriminations.max())
+        if max_change >= min_raw_step or self.convergence_threshold >= min_raw_step:
+            return 0
+
+        end_theta = max(self.theta_bounds[0], min(self.theta_bounds[1],
+                                                  current_theta + direction * self.ABSOLUTE_MAX_TOTAL_CHANGE))
+        min_curvature = _min_curvature(current_theta, end_theta, difficulties, discriminations,
+                                       guessings, self.PROBABILITY_EPSILON)
+        if min_curvature <= 2 * self.MIN_SECOND_DERIVATIVE:
+            return 0
+
+        return direction
 
     def _calculate_theta_with_newton_raphson(self, current_theta: float,
                                              responses: List[Tuple[bool, float, float, float]],
@@ -778,11 +1460,6 @@ class IRTEngine:
         if not responses:
             return current_theta, {'method': 'no_responses', 'change': 0.0}
 
-        theta = current_theta
-        iterations_used = 0
-        total_change = 0.0
-        converged = False
-
         # Adjust smoothing based on questions answered
         if questions_answered <= self.EARLY_QUESTIONS_COUNT:
             smoothing_alpha = 0.3
@@ -793,66 +1470,28 @@ class IRTEngine:
         else:
             smoothing_alpha = min(0.7, self.base_exponential_smoothing_alpha)
 
-        for iteration in range(self.newton_raphson_iterations):
-            iterations_used = iteration + 1
-            likelihood_derivative = 0.0
-            second_derivative = 0.0
-
-            for is_correct, difficulty, discrimination, guessing in responses:
-                p = self.cached_probability_correct(theta, difficulty, discrimination, guessing)
-                p = max(min(p, 1.0 - self.PROBABILITY_EPSILON), self.PROBABILITY_EPSILON)
-                q = 1 - p
-
-                discrimination = max(0.1, min(discrimination, 3.0))
-
-                if is_correct:
-                    likelihood_derivative += discrimination * q / p
-                else:
-                    likelihood_derivative -= discrimination * p / q
-
-                second_derivative -= discrimination ** 2 * p * q
-
-            if abs(second_derivative) < self.MIN_SECOND_DERIVATIVE:
-                break
-
-            raw_delta_theta = -likelihood_derivative / second_derivative
-
-            if abs(raw_delta_theta) < self.convergence_threshold:
-                converged = True
-                break
-
-            # Apply max change limits
-            if questions_answered <= self.EARLY_QUESTIONS_COUNT:
-                max_change = self.EARLY_QUESTIONS_MAX_CHANGE
-            else:
-                max_change = min(self.max_theta_change, self.MAX_SINGLE_STEP)
+        is_correct, difficulties, discriminations, guessings = _response_columns(responses)
+        discriminations = np.clip(discriminations, 0.1, 3.0)
+        guessings = np.clip(guessings, 0.0, 0.4)
 
-            delta_theta = raw_delta_theta
-            if abs(delta_theta) > max_change:
-                delta_theta = max_change if delta_theta > 0 else -max_change
-
-            # Check total change budget
-            potential_total_change = abs(total_change + delta_theta)
-            if potential_total_change > self.ABSOLUTE_MAX_TOTAL_CHANGE:
-                remaining_budget = self.ABSOLUTE_MAX_TOTAL_CHANGE - abs(total_change)
-                delta_theta = remaining_budget if delta_theta > 0 else -remaining_budget
-
-                if abs(delta_theta) < self.convergence_threshold:
-                    break
-
-            new_theta = theta + delta_theta
-            total_change += delta_theta
-
-            # Apply bounds
-            bounded_theta = max(self.theta_bounds[0], min(self.theta_bounds[1], new_theta))
-            if bounded_theta != new_theta:
-                total_change = total_change - delta_theta + (bounded_theta - theta)
+        # Per-step limit depends only on questions_answered
+        if questions_answered <= self.EARLY_QUESTIONS_COUNT:
+            max_change = self.EARLY_QUESTIONS_MAX_CHANGE
+        else:
+            max_change = min(self.max_theta_change, self.MAX_SINGLE_STEP)
 
-            theta = bounded_theta
+        # All-correct / all-incorrect input has no finite MLE; when every step is
+        # known to be clipped to max_change, march without evaluating derivatives
+        march_direction = self._identical_response_direction(
+            current_theta, is_correct, difficulties, discriminations, guessings, max_change
+        )
 
-            if abs(theta - (theta - delta_theta)) < self.convergence_threshold:
-                converged = True
-                break
+        theta, iterations_used, converged = _newton_raphson_loop(
+            float(current_theta), is_correct, difficulties, discriminations, guessings,
+            self.PROBABILITY_EPSILON, self.newton_raphson_iterations, float(max_change),
+            march_direction, self.MIN_SECOND_DERIVATIVE, self.convergence_threshold,
+            self.ABSOLUTE_MAX_TOTAL_CHANGE, float(self.theta_bounds[0]), float(self.theta_bounds[1])
+        )
 
         # Apply exponential smoothing
         smoothing_alpha = smoothing_alpha * (0.8 if converged else 1.0)
@@ -912,7 +1551,7 @@ class IRTEngine:
             info['method'] = 'cumulative_newton_raphson'
             info['window_phase'] = 'building'
 
-            logger.debug(f"Phase 1 (CUMULATIVE): Using all {len(responses)} responses")
+            logger.debug("Phase 1 (CUMULATIVE): Using all %d responses", len(responses))
 
         elif questions_answered <= self.window_transition_end:
             # Phase 2: BLENDED (smooth transition)
@@ -921,10 +1560,14 @@ class IRTEngine:
                 current_theta, responses, questions_answered
             )
 
-            windowed_responses = responses[-self.response_window_size:]
-            windowed_theta, windowed_info = self._calculate_theta_with_newton_raphson(
-                current_theta, windowed_responses, questions_answered
-            )
+            if len(responses) <= self.response_window_size:
+                # The window holds every response, so the windowed estimate is the cumulative one
+                windowed_theta, windowed_info = cumulative_theta, dict(cumulative_info)
+            else:
+                windowed_responses = responses[-self.response_window_size:]
+                windowed_theta, windowed_info = self._calculate_theta_with_newton_raphson(
+                    current_theta, windowed_responses, questions_answered
+                )
 
             # Linear blend based on question count
             blend_factor = (questions_answered - self.window_transition_start) / \
@@ -944,9 +1587,8 @@ class IRTEngine:
                 'questions_answered': questions_answered
             }
 
-            logger.debug(f"Phase 2 (BLENDED): blend={blend_factor:.2f}, "
-                        f"cumulative={cumulative_theta:.3f}, windowed={windowed_theta:.3f}, "
-                        f"final={new_theta:.3f}")
+            logger.debug("Phase 2 (BLENDED): blend=%.2f, cumulative=%.3f, windowed=%.3f, final=%.3f",
+                         blend_factor, cumulative_theta, windowed_theta, new_theta)
 
         else:
             # Phase 3: WINDOWED (responsive to recent performance)
@@ -958,7 +1600,7 @@ class IRTEngine:
             info['window_phase'] = 'mature'
             info['window_size'] = len(windowed_responses)
 
-            logger.debug(f"Phase 3 (WINDOWED): Using last {len(windowed_responses)} responses")
+            logger.debug("Phase 3 (WINDOWED): Using last %d responses", len(windowed_responses))
 
         info['consecutive_info'] = consecutive_info
 
@@ -979,19 +1621,18 @@ class IRTEngine:
             if response_history and len(response_history) >= 1:
                 last_response = response_history[-1]
 
-                # Wrong answer → theta cannot increase
-                if not last_response and new_theta > current_theta:
-                    logger.info(f"❌ CONSTRAINT: Theta increase blocked after incorrect response "
-                               f"({new_theta:.3f} clamped to {current_theta:.3f})")
+                # Wrong answer → theta cannot increase; correct answer → theta cannot decrease.
+                # Signed so both cases are one comparison (NaN still never clamps)
+                if (new_theta - current_theta) * (1.0 if last_response else -1.0) < 0:
+                    if logger.isEnabledFor(logging.INFO):
+                        if last_response:
+                            logger.info(f"✅ CONSTRAINT: Theta decrease blocked after correct response "
+                                        f"({new_theta:.3f} clamped to {current_theta:.3f})")
+                        else:
+                            logger.info(f"❌ CONSTRAINT: Theta increase blocked after incorrect response "
+                                        f"({new_theta:.3f} clamped to {current_theta:.3f})")
                     new_theta = current_theta
-                    info['response_constraint'] = 'incorrect_no_increase'
-
-                # Correct answer → theta cannot decrease
-                elif last_response and new_theta < current_theta:
-                    logger.info(f"✅ CONSTRAINT: Theta decrease blocked after correct response "
-                               f"({new_theta:.3f} clamped to {current_theta:.3f})")
-                    new_theta = current_theta
-                    info['response_constraint'] = 'correct_no_decrease'
+                    info['response_constraint'] = 'correct_no_decrease' if last_response else 'incorrect_no_increase'
 
             # Early question protection
             if questions_answered <= self.EARLY_QUESTIONS_COUNT:
@@ -1000,7 +1641,7 @@ class IRTEngine:
                 if abs(actual_change) > max_change:
                     new_theta = current_theta + max_change * (1 if actual_change > 0 else -1)
                     info['early_protection_applied'] = True
-                    logger.info(f"Early protection: limiting change to +/-{max_change}")
+                    logger.info("Early protection: limiting change to +/-%s", max_change)
 
             # Update velocity
             velocity = new_theta - current_theta
@@ -1013,7 +1654,7 @@ class IRTEngine:
                 info['method'] = 'eap_fallback'
 
             # Response time adjustment
-            if self.adaptive_config.enable_response_time and response_times:
+            if self.adaptive_config.enable_response_time and response_times is not None and len(response_times):
                 time_adjustment = self.calculate_response_time_adjustment(
                     new_theta, responses, response_times
                 )
@@ -1032,17 +1673,13 @@ class IRTEngine:
     def calculate_eap_estimate(self, responses: List[Tuple[bool, float, float, float]],
                                prior_theta: float = 0.0) -> float:
         """Expected A Posteriori estimate as fallback"""
-        theta_range = np.linspace(self.theta_bounds[0], self.theta_bounds[1], 100)
-        prior = np.exp(-0.5 * (theta_range - prior_theta) ** 2) / np.sqrt(2 * np.pi)
-
-        likelihood = np.ones_like(theta_range)
-        for is_correct, difficulty, discrimination, guessing in responses:
-            for i, theta in enumerate(theta_range):
-                p = self.probability_correct(theta, difficulty, discrimination, guessing)
-                if is_correct:
-                    likelihood[i] *= p
-                else:
-                    likelihood[i] *= (1 - p)
+        theta_range = self._eap_theta_grid
+        # -0.5 * (theta - prior_theta)^2, shifted from the precomputed zero-mean log prior
+        prior = np.exp(self._eap_log_prior + prior_theta * theta_range - 0.5 * prior_theta ** 2)
+
+        is_correct, p = _grid_probabilities(theta_range, responses)
+        # Reducing over the response axis multiplies row by row, i.e. in response order
+        likelihood = np.where(is_correct[:, None], p, 1 - p).prod(axis=0)
 
         posterior = likelihood * prior
         posterior /= np.sum(posterior)
@@ -1053,18 +1690,11 @@ class IRTEngine:
     def calculate_mle_estimate(self, responses: List[Tuple[bool, float, float, float]],
                                initial_theta: float = 0.0) -> float:
         """Maximum Likelihood Estimate as fallback"""
-        theta_range = np.linspace(self.theta_bounds[0], self.theta_bounds[1], 200)
-        log_likelihoods = []
-
-        for theta in theta_range:
-            log_likelihood = 0.0
-            for is_correct, difficulty, discrimination, guessing in responses:
-                p = self.probability_correct(theta, difficulty, discrimination, guessing)
-                if is_correct:
-                    log_likelihood += np.log(max(p, 1e-10))
-                else:
-                    log_likelihood += np.log(max(1 - p, 1e-10))
-            log_likelihoods.append(log_likelihood)
+        theta_range = self._mle_theta_grid
+        is_correct, p = _grid_probabilities(theta_range, responses)
+        # Summed row by row over the response axis, so each grid point accumulates
+        # in response order (no pairwise reordering that could move the argmax)
+        log_likelihoods = np.log(np.maximum(np.where(is_correct[:, None], p, 1 - p), 1e-10)).sum(axis=0)
 
         best_idx = np.argmax(log_likelihoods)
         return float(theta_range[best_idx])
@@ -1076,19 +1706,15 @@ class IRTEngine:
         if len(responses) != len(response_times):
             return 0.0
 
-        adjustments = []
-        for (is_correct, difficulty, _, _), response_time in zip(responses, response_times):
-            expected_time = 5.0 + 2.0 * abs(theta - difficulty)
-            time_ratio = response_time / expected_time
+        is_correct, difficulties, _, _ = _response_columns(responses)
+        expected_times = 5.0 + 2.0 * np.abs(theta - difficulties)
+        time_ratios = np.asarray(response_times, dtype=np.float64) / expected_times
 
-            if is_correct and time_ratio < 0.7:
-                adjustments.append(0.05)
-            elif not is_correct and time_ratio > 1.5:
-                adjustments.append(-0.05)
-            elif is_correct and time_ratio > 2.0:
-                adjustments.append(-0.02)
+        adjustments = (np.where(is_correct & (time_ratios < 0.7), 0.05, 0.0)
+                       + np.where(~is_correct & (time_ratios > 1.5), -0.05, 0.0)
+                       + np.where(is_correct & (time_ratios > 2.0), -0.02, 0.0))
 
-        return sum(adjustments)
+        return float(adjustments.sum())
 
     def should_stop_with_confidence(self, sem: float, questions_asked: int,
                                     response_history: List[bool]) -> Tuple[bool, float]:
@@ -1102,7 +1728,7 @@ class IRTEngine:
 
         if len(self.theta_history) >= 5:
             recent_thetas = self.theta_history[-5:]
-            theta_variance = np.var(recent_thetas)
+            theta_variance = _short_variance(recent_thetas)
             if theta_variance < 0.01:
                 logger.info(f"Theta stabilized with variance {theta_variance:.4f}")
                 return True, 0.95
@@ -1119,8 +1745,7 @@ class IRTEngine:
                             f"consecutive {consecutive_info['response_type']} responses")
                 return True, confidence
 
-            recent = response_history[-8:]
-            accuracy = sum(recent) / len(recent)
+            accuracy = _recent_correct_count(response_history, 8) / 8
             if accuracy == 1.0 or accuracy == 0.0:
                 return True, 0.90
 
@@ -1177,7 +1802,7 @@ class IRTEngine:
             test_purpose = self.test_purpose
 
         # Get config for the specified test purpose
-        config = AdaptiveConfig.get_config(test_purpose)
+        config = _purpose_config(test_purpose)
 
         # Check minimum
         if questions_answered < config.min_questions:
@@ -1213,74 +1838,80 @@ class IRTEngine:
                 'test_completed': False
             }
 
-        correct_count = sum(1 for r, _, _, _ in responses if r)
-        total_questions = len(responses)
+        batch = ResponseBatch.from_responses(responses)
+        correct_count = int(batch.is_correct.sum())
+        total_questions = len(batch)
         accuracy = correct_count / total_questions
 
-        final_sem = self.calculate_sem(
-            final_theta,
-            [(d, a, g) for _, d, a, g in responses]
-        )
+        # One information pass feeds both the SEM and the efficiency figures
+        item_information = _information_vec(final_theta, batch.b, batch.a, batch.g)
+        total_information = float(np.sum(item_information))
+        final_sem = 1.0 / math.sqrt(total_information) if total_information > 0 else 1.0
         confidence_interval = (
             final_theta - 1.96 * final_sem,
             final_theta + 1.96 * final_sem
         )
 
         content_performance = {}
+        strengths = []
+        weaknesses = []
         if self.adaptive_config.enable_content_balancing and question_details:
-            content_areas_data = {}
-            for i, (is_correct, _, _, _) in enumerate(responses):
-                if i < len(question_details):
-                    q_detail = question_details[i]
-                    area = q_detail.get('content_area', q_detail.get('topic', 'default'))
-                    if area not in content_areas_data:
-                        content_areas_data[area] = []
-                    content_areas_data[area].append(is_correct)
-
-            for area, area_responses in content_areas_data.items():
-                if area_responses:
-                    area_accuracy = sum(area_responses) / len(area_responses)
-                    content_performance[area] = {
-                        'questions': len(area_responses),
-                        'accuracy': area_accuracy,
-                        'strength_level': 'Strong' if area_accuracy > 0.75 else
-                        'Weak' if area_accuracy < 0.40 else 'Moderate'
-                    }
+            # Factorize areas in first-seen order, then tally with two bincounts
+            n_detailed = min(total_questions, len(question_details))
+            area_codes = {}
+            codes = np.fromiter(
+                (area_codes.setdefault(q.get('content_area', q.get('topic', 'default')), len(area_codes))
+                 for q in question_details[:n_detailed]),
+                dtype=np.intp, count=n_detailed
+            )
+            area_counts = np.bincount(codes, minlength=len(area_codes))
+            area_correct = np.bincount(codes, weights=batch.is_correct[:n_detailed],
+                                       minlength=len(area_codes))
+            area_accuracies = area_correct / np.maximum(area_counts, 1)
+            # 0 = Strong, 1 = Weak, 2 = Moderate
+            area_levels = np.select([area_accuracies > 0.75, area_accuracies < 0.40], [0, 1], default=2)
+
+            areas = list(area_codes)
+            for code, area in enumerate(areas):
+                content_performance[area] = {
+                    'questions': int(area_counts[code]),
+                    'accuracy': float(area_accuracies[code]),
+                    'strength_level': _STRENGTH_LEVELS[area_levels[code]]
+                }
+            strengths = [areas[code] for code in np.flatnonzero(area_levels == 0)]
+            weaknesses = [areas[code] for code in np.flatnonzero(area_levels == 1)]
 
         consecutive_info = self.detect_consecutive_responses(response_history)
-        max_consecutive_correct = self._count_max_consecutive(response_history, True)
-        max_consecutive_incorrect = self._count_max_consecutive(response_history, False)
+        max_consecutive_correct, max_consecutive_incorrect = self._count_max_consecutive_runs(response_history)
 
-        difficulties = [d for _, d, _, _ in responses]
-        difficulty_trend = 'increasing' if len(difficulties) > 1 and difficulties[-1] > difficulties[0] else \
-            'decreasing' if len(difficulties) > 1 and difficulties[-1] < difficulties[0] else \
+        difficulties = batch.b
+        first_difficulty, last_difficulty = difficulties[0], difficulties[-1]
+        difficulty_trend = 'increasing' if total_questions > 1 and last_difficulty > first_difficulty else \
+            'decreasing' if total_questions > 1 and last_difficulty < first_difficulty else \
                 'stable'
 
-        total_information = sum(
-            self.information(final_theta, d, a, g)
-            for _, d, a, g in responses
-        )
         avg_information = total_information / total_questions if total_questions > 0 else 0
 
         time_analysis = {}
-        if response_times and len(response_times) == total_questions:
-            avg_time = np.mean(response_times)
+        if response_times is not None and 0 < len(response_times) == total_questions:
+            times = np.asarray(response_times, dtype=np.float64)
             time_analysis = {
-                'average_response_time': avg_time,
-                'fastest_response': min(response_times),
-                'slowest_response': max(response_times),
-                'time_consistency': np.std(response_times)
+                'average_response_time': float(times.mean()),
+                'fastest_response': float(times.min()),
+                'slowest_response': float(times.max()),
+                'time_consistency': float(times.std())
             }
 
+        estimated_tier = self.theta_to_tier(final_theta)
+
         report = {
             'final_ability': final_theta,
-            'final_tier': self.theta_to_tier(final_theta),
-            'estimated_tier': self.theta_to_tier(final_theta),  # Theta-based
+            'final_tier': estimated_tier,
+            'estimated_tier': estimated_tier,  # Theta-based
             'active_tier': self._apply_conservative_fairness_constraints(
-                self.theta_to_tier(final_theta),
-                response_history,
-                consecutive_info
-            ) if len(response_history) >= self.min_questions_before_tier_change else self.theta_to_tier(final_theta),
+                estimated_tier,
+                response_history
+            ) if len(response_history) >= self.min_questions_before_tier_change else estimated_tier,
             'confidence_interval': confidence_interval,
             'final_sem': final_sem,
             'questions_answered': total_questions,
@@ -1297,14 +1928,14 @@ class IRTEngine:
                 'max_consecutive_incorrect': max_consecutive_incorrect,
                 'final_pattern': consecutive_info,
                 'difficulty_trend': difficulty_trend,
-                'average_difficulty': np.mean(difficulties) if difficulties else 0,
-                'difficulty_progression': difficulties
+                'average_difficulty': difficulties.mean(),
+                'difficulty_progression': difficulties.tolist()
             },
             'theta_progression': {
                 'initial_theta': self.theta_history[0] if self.theta_history else final_theta,
                 'final_theta': final_theta,
                 'total_change': final_theta - (self.theta_history[0] if self.theta_history else final_theta),
-                'stability': np.var(self.theta_history[-5:]) if len(self.theta_history) >= 5 else None,
+                'stability': _short_variance(self.theta_history[-5:]) if len(self.theta_history) >= 5 else None,
                 'history': self.theta_history
             },
             'time_analysis': time_analysis,
@@ -1322,14 +1953,6 @@ class IRTEngine:
             } if self.use_windowed_theta else None
         }
 
-        strengths = []
-        weaknesses = []
-        if content_performance:
-            strengths = [area for area, data in content_performance.items()
-                         if data.get('strength_level') == 'Strong']
-            weaknesses = [area for area, data in content_performance.items()
-                          if data.get('strength_level') == 'Weak']
-
         report['summary'] = {
             'strengths': strengths,
             'weaknesses': weaknesses,
@@ -1342,13 +1965,16 @@ class IRTEngine:
         return report
 
     def update_theta(self, current_theta: float,
-                     responses: List[Tuple[bool, float, float, float]],
+                     responses: Union[List[Tuple[bool, float, float, float]], 'ResponseBatch'],
                      response_history: List[bool] = None,
                      response_times: List[float] = None,
                      questions_answered: int = 0) -> Tuple[float, Dict[str, Any]]:
         """Main theta update method using sliding window approach"""
         if response_history is None:
-            response_history = [r[0] for r in responses]
+            if isinstance(responses, ResponseBatch):
+                response_history = responses.is_correct.tolist()
+            else:
+                response_history = [r[0] for r in responses]
 
         new_theta, info = self.robust_theta_update(
             current_theta, responses, response_history, response_times, questions_answered
@@ -1358,9 +1984,8 @@ class IRTEngine:
 
         # Calculate both tiers for display
         estimated_tier = self.theta_to_tier(new_theta)  # Simple theta mapping
-        consecutive_info = self.detect_consecutive_responses(response_history)
         active_tier = self._apply_conservative_fairness_constraints(
-            estimated_tier, response_history, consecutive_info
+            estimated_tier, response_history
         )  # Actually used for question selection
 
         # Add tier information to response
@@ -1368,19 +1993,29 @@ class IRTEngine:
         info['active_tier'] = active_tier
         info['tier_alignment'] = (estimated_tier == active_tier)
 
-        logger.info(f"Theta updated: {current_theta:.3f} -> {new_theta:.3f} "
-                    f"(delta={new_theta - current_theta:+.3f}), Q={questions_answered}, "
-                    f"method={info.get('method', 'unknown')}, "
-                    f"tiers: estimated={estimated_tier}, active={active_tier}")
+        logger.info("Theta updated: %.3f -> %.3f (delta=%+.3f), Q=%s, method=%s, "
+                    "tiers: estimated=%s, active=%s",
+                    current_theta, new_theta, new_theta - current_theta, questions_answered,
+                    info.get('method', 'unknown'), estimated_tier, active_tier)
 
         return new_theta, info
 
     def calculate_sem(self, theta: float,
-                      questions_info: List[Tuple[float, float, float]]) -> float:
-        """Calculate Standard Error of Measurement"""
-        total_info = 0.0
-        for difficulty, discrimination, guessing in questions_info:
-            total_info += self.information(theta, difficulty, discrimination, guessing)
+                      questions_info: Union[List[Tuple[float, float, float]], 'ResponseBatch']) -> float:
+        """Calculate Standard Error of Measurement from (b, a, c) tuples or a ResponseBatch"""
+        if isinstance(questions_info, ResponseBatch):
+            difficulty, discrimination, guessing = questions_info.b, questions_info.a, questions_info.g
+        else:
+            if len(questions_info) == 0:
+                return 1.0
+            columns = np.array(questions_info, dtype=np.float64)
+            if columns.ndim != 2 or columns.shape[1] != 3:
+                raise ValueError("questions_info must contain (difficulty, discrimination, guessing) tuples")
+            if not np.isfinite(columns).all():
+                raise ValueError("Item parameters must be finite numbers")
+            difficulty, discrimination, guessing = columns.T
+
+        total_info = float(np.sum(_information_vec(theta, difficulty, discrimination, guessing)))
 
         if total_info <= 0:
             return 1.0
@@ -1389,10 +2024,13 @@ class IRTEngine:
 
     def _apply_conservative_fairness_constraints(self, current_tier: str,
                                                  response_history: List[bool],
-                                                 consecutive_info: Dict[str, Any]) -> str:
+                                                 consecutive_info: Optional[Dict[str, Any]] = None) -> str:
         """
         Apply conservative single-tier progression constraints with response-based rules.
 
+        The rules only look at the last response and the promotion/demotion windows;
+        `consecutive_info` is accepted for backward compatibility and not used.
+
         NEW CONTRACTS:
         - Wrong answer → NEVER promote tier
         - Correct answer → NEVER demote tier
@@ -1414,14 +2052,13 @@ class IRTEngine:
 
             # Still allow demotion to proceed after incorrect response
             if len(response_history) >= self.tier_demotion_window:
-                recent_window = response_history[-self.tier_demotion_window:]
-                correct_count = sum(recent_window)
+                correct_count = _recent_correct_count(response_history, self.tier_demotion_window)
 
                 if correct_count <= self.tier_demotion_threshold:
                     new_tier = self._adjust_tier_down(current_tier)
                     if new_tier != current_tier:
-                        logger.info(f"TIER DEMOTION: {current_tier} -> {new_tier} "
-                                    f"({correct_count}/{self.tier_demotion_window} correct)")
+                        logger.info("TIER DEMOTION: %s -> %s (%s/%s correct)",
+                                    current_tier, new_tier, correct_count, self.tier_demotion_window)
                         return new_tier
             return current_tier
 
@@ -1431,14 +2068,13 @@ class IRTEngine:
 
             # Only allow promotion after correct response
             if len(response_history) >= self.tier_promotion_window:
-                recent_window = response_history[-self.tier_promotion_window:]
-                correct_count = sum(recent_window)
+                correct_count = _recent_correct_count(response_history, self.tier_promotion_window)
 
                 if correct_count >= self.tier_promotion_threshold:
                     new_tier = self._adjust_tier_up(current_tier)
                     if new_tier != current_tier:
-                        logger.info(f"TIER PROMOTION: {current_tier} -> {new_tier} "
-                                    f"({correct_count}/{self.tier_promotion_window} correct)")
+                        logger.info("TIER PROMOTION: %s -> %s (%s/%s correct)",
+                                    current_tier, new_tier, correct_count, self.tier_promotion_window)
                         return new_tier
             return current_tier
 
@@ -1447,74 +2083,97 @@ class IRTEngine:
 
     def _adjust_tier_up(self, tier: str) -> str:
         """Adjust tier up by exactly one level"""
-        tier_order = ["C1", "C2", "C3", "C4"]
-        try:
-            current_index = tier_order.index(tier)
-            new_index = min(current_index + 1, len(tier_order) - 1)
-            return tier_order[new_index]
-        except ValueError:
+        current_index = _TIER_INDEX.get(tier)
+        if current_index is None:
             logger.warning(f"Unknown tier: {tier}, defaulting to C1")
             return "C1"
+        return _TIER_LABELS[min(current_index + 1, len(_TIER_LABELS) - 1)]
 
     def _adjust_tier_down(self, tier: str) -> str:
         """Adjust tier down by exactly one level"""
-        tier_order = ["C1", "C2", "C3", "C4"]
-        try:
-            current_index = tier_order.index(tier)
-            new_index = max(current_index - 1, 0)
-            return tier_order[new_index]
-        except ValueError:
+        current_index = _TIER_INDEX.get(tier)
+        if current_index is None:
             logger.warning(f"Unknown tier: {tier}, defaulting to C1")
             return "C1"
+        return _TIER_LABELS[max(current_index - 1, 0)]
+
+    def _bank_for(self, questions: Union[List[Dict], 'QuestionBank']) -> 'QuestionBank':
+        """
+        Column view of `questions`. A list is read afresh on every call, since
+        callers may change it between calls; pass a QuestionBank to reuse one.
+        """
+        if isinstance(questions, QuestionBank):
+            return questions
+        return QuestionBank(questions)
+
+    def _rows_in_tier(self, bank: 'QuestionBank', rows: np.ndarray, tier: str) -> np.ndarray:
+        """Subset of `rows` with tier-appropriate difficulty and discrimination"""
+        bounds = self._tier_filter_bounds.get(tier)
+        if bounds is None:
+            logger.warning(f"Unknown tier {tier}, using C1 ranges")
+            bounds = self._tier_filter_bounds["C1"]
+
+        mask = bank.tier_mask(bounds)
+        return rows[mask[rows]]
+
+    def _candidate_information(self, theta: float, bank: 'QuestionBank', rows: np.ndarray) -> np.ndarray:
+        """Fisher information at theta for every question in `rows`, in one vector pass"""
+        return bank.information(theta, rows)
+
+    def _rows_not_asked(self, bank: 'QuestionBank', rows: np.ndarray) -> np.ndarray:
+        """Subset of `rows` whose question id has not been asked yet"""
+        asked = self.asked_question_ids
+        if len(asked) < len(rows):
+            # Usually far fewer questions asked than candidates: mark the asked rows instead
+            return rows[~bank.rows_with_ids(asked)[rows]]
+        questions = bank.questions
+        keep = np.fromiter((questions[i].get('id') not in asked for i in rows.tolist()),
+                           dtype=bool, count=len(rows))
+        return rows[keep]
 
     def _filter_questions_by_tier(self, questions: List[Dict], tier: str) -> List[Dict]:
         """Filter questions by tier-appropriate difficulty and discrimination"""
-        if tier not in self.tier_difficulty_ranges:
-            logger.warning(f"Unknown tier {tier}, using C1 ranges")
-            tier = "C1"
+        bank = self._bank_for(questions)
+        filtered = bank.take(self._rows_in_tier(bank, np.arange(bank.size), tier))
 
-        difficulty_range = self.tier_difficulty_ranges[tier]
-        discrimination_range = self.tier_discrimination_ranges[tier]
+        logger.debug(f"Filtered {len(filtered)}/{len(questions)} questions for tier {tier}")
+        return filtered
 
-        filtered = []
-        for q in questions:
-            difficulty_b = q.get('difficulty_b', 0.0)
-            discrimination_a = q.get('discrimination_a', 1.0)
+    def _count_max_consecutive_runs(self, response_history: List[bool]) -> Tuple[int, int]:
+        """Longest correct and longest incorrect streak, from one run-length pass"""
+        if isinstance(response_history, ResponseHistory):
+            return response_history.longest_runs
+        if len(response_history) == 0:
+            return 0, 0
 
-            if (difficulty_range[0] <= difficulty_b <= difficulty_range[1] and
-                    discrimination_range[0] <= discrimination_a <= discrimination_range[1]):
-                filtered.append(q)
+        flags = np.asarray(response_history, dtype=bool)
+        run_starts = np.r_[0, np.flatnonzero(flags[1:] != flags[:-1]) + 1]
+        run_lengths = np.diff(np.r_[run_starts, len(flags)])
+        run_values = flags[run_starts]
 
-        logger.debug(f"Filtered {len(filtered)}/{len(questions)} questions for tier {tier}")
-        return filtered
+        max_correct = int(run_lengths[run_values].max()) if run_values.any() else 0
+        max_incorrect = int(run_lengths[~run_values].max()) if not run_values.all() else 0
+        return max_correct, max_incorrect
 
     def _count_max_consecutive(self, response_history: List[bool],
                                target_response: bool) -> int:
         """Count maximum consecutive responses of a specific type"""
-        if not response_history:
-            return 0
-
-        max_consecutive = 0
-        current_consecutive = 0
-
-        for response in response_history:
-            if response == target_response:
-                current_consecutive += 1
-                max_consecutive = max(max_consecutive, current_consecutive)
-            else:
-                current_consecutive = 0
-
-        return max_consecutive
+        max_correct, max_incorrect = self._count_max_consecutive_runs(response_history)
+        return max_correct if target_response else max_incorrect
 
     def calculate_assessment_metrics(self, responses: List[Tuple[bool, float, float, float]],
                                      final_theta: float,
                                      response_history: List[bool] = None,
                                      question_details: List[Dict] = None) -> Dict:
         """Calculate final assessment metrics"""
+        if not response_history:
+            # A batch already holds the flags as one array; only tuple lists need the scan
+            response_history = (responses.is_correct.tolist() if isinstance(responses, ResponseBatch)
+                                else [r[0] for r in responses])
         return self.generate_diagnostic_report(
             final_theta,
             responses,
-            response_history or [r[0] for r in responses],
+            response_history,
             response_times=self.question_response_times,
             question_details=question_details
         )
@@ -1531,85 +2190,84 @@ class IRTEngine:
 
     def clear_caches(self):
         """Clear performance optimization caches"""
-        self._information_cache.clear()
-        self._probability_cache.clear()
-        self.cached_probability_correct.cache_clear()
+        self._rt_weight_memo = (None, 1.0)
         logger.info("Cleared all caches")
 
     def run_adaptive_assessment(self, initial_competence: str,
-                                question_bank: List[Dict],
+                                question_bank: Union[List[Dict], 'QuestionBank'],
                                 enable_response_times: bool = False) -> Dict:
         """
         Run a complete adaptive assessment with all contracts enforced.
+
+        `question_bank` may be a list of question dicts or a prebuilt QuestionBank.
         """
         current_theta = self.initialize_assessment(initial_competence)
 
-        responses = []
-        response_history = []
-        response_times = [] if enable_response_times else None
-        available_questions = question_bank.copy()
+        # One batch grows in place for the whole run; update_theta reads it directly
+        responses = ResponseBatch(capacity=self.max_questions)
+        self.cumulative_responses = responses
+        response_history = ResponseHistory()
+        # Filled in place and passed as a view, so the RT adjustment gets an array without a copy
+        response_times = np.empty(self.max_questions, dtype=np.float64) if enable_response_times else None
+        # Availability is a mask over bank rows, so taking a question is O(1)
+        bank = question_bank if isinstance(question_bank, QuestionBank) else QuestionBank(question_bank)
+        available = np.ones(bank.size, dtype=bool)
         questions_answered = 0
         question_details = []
 
-        logger.info(f"Starting assessment: {len(available_questions)} questions, "
-                    f"multiplier={self.adaptive_config.anticipation_multiplier}x, "
-                    f"windowing={'ENABLED' if self.use_windowed_theta else 'DISABLED'}, "
-                    f"response-based constraints: ENABLED")
+        logger.info("Starting assessment: %s questions, multiplier=%sx, windowing=%s, "
+                    "response-based constraints: ENABLED",
+                    bank.size, self.adaptive_config.anticipation_multiplier,
+                    'ENABLED' if self.use_windowed_theta else 'DISABLED')
 
         while questions_answered < self.max_questions:
-            next_question = self.select_next_question(
+            next_row = self._select_next_row(
                 theta=current_theta,
-                available_questions=available_questions,
+                bank=bank,
+                rows=np.flatnonzero(available),
                 response_history=response_history,
                 questions_answered=questions_answered
             )
 
-            if not next_question:
+            if next_row is None:
                 logger.warning("No more suitable questions available")
                 break
 
-            available_questions.remove(next_question)
+            available[next_row] = False
+            next_question = bank.questions[next_row]
             question_details.append(next_question)
 
-            prob_correct = self.probability_correct(
-                current_theta,
-                next_question['difficulty_b'],
-                next_question['discrimination_a'],
-                next_question.get('guessing_c', 0.25)
-            )
+            difficulty = next_question['difficulty_b']
+            discrimination = next_question['discrimination_a']
+            guessing = next_question.get('guessing_c', 0.25)
+
+            # theta moves after every response, so a cached lookup would almost never hit
+            prob_correct = _probability_3pl(current_theta, difficulty, discrimination, guessing)
             is_correct = random.random() < prob_correct
 
-            response_tuple = (
-                is_correct,
-                next_question['difficulty_b'],
-                next_question['discrimination_a'],
-                next_question.get('guessing_c', 0.25)
-            )
+            response_tuple = (is_correct, difficulty, discrimination, guessing)
             responses.append(response_tuple)
             response_history.append(is_correct)
-            self.cumulative_responses.append(response_tuple)
 
             if enable_response_times:
                 base_time = 15.0
-                difficulty_distance = abs(current_theta - next_question['difficulty_b'])
+                difficulty_distance = abs(current_theta - difficulty)
                 simulated_time = base_time + random.uniform(-5, 5) + difficulty_distance * 3
-                response_times.append(simulated_time)
-                self.question_response_times.append(simulated_time)
+                response_times[questions_answered] = simulated_time
+                self.record_response_time(simulated_time)
 
             questions_answered += 1
 
             current_theta, update_info = self.update_theta(
                 current_theta=current_theta,
-                responses=self.cumulative_responses,
+                responses=responses,
                 response_history=response_history,
-                response_times=response_times if response_times else None,
+                response_times=response_times[:questions_answered] if enable_response_times else None,
                 questions_answered=questions_answered
             )
 
-            current_sem = self.calculate_sem(
-                current_theta,
-                [(r[1], r[2], r[3]) for r in responses]
-            )
+            # Exact SEM at the new theta: one vectorised pass over the batch columns
+            current_sem = self.calculate_sem(current_theta, responses)
 
             should_stop, confidence = self.should_stop_with_confidence(
                 sem=current_sem,
@@ -1618,23 +2276,23 @@ class IRTEngine:
             )
 
             if should_stop and questions_answered >= self.min_questions:
-                logger.info(f"Stopping: questions={questions_answered}, "
-                            f"SEM={current_sem:.3f}, confidence={confidence:.2f}")
+                logger.info("Stopping: questions=%s, SEM=%.3f, confidence=%.2f",
+                            questions_answered, current_sem, confidence)
                 break
 
         final_report = self.generate_diagnostic_report(
             final_theta=current_theta,
             responses=responses,
             response_history=response_history,
-            response_times=response_times,
+            response_times=response_times[:questions_answered] if enable_response_times else None,
             question_details=question_details
         )
 
         final_report['assessment_metadata'] = {
             'initial_competence': initial_competence,
             'initial_theta': self.theta_history[0] if self.theta_history else current_theta,
-            'question_bank_size': len(question_bank),
-            'questions_remaining': len(available_questions),
+            'question_bank_size': bank.size,
+            'questions_remaining': int(np.count_nonzero(available)),
             'test_purpose': self.test_purpose.value,
             'response_times_enabled': enable_response_times,
             'rt_weighted_info_enabled': self.adaptive_config.enable_rt_weighted_information,
@@ -1643,8 +2301,8 @@ class IRTEngine:
             'sliding_window_enabled': self.use_windowed_theta
         }
 
-        logger.info(f"Assessment completed: theta={current_theta:.3f}, "
-                    f"questions={questions_answered}, tier={final_report['final_tier']}")
+        logger.info("Assessment completed: theta=%.3f, questions=%s, tier=%s",
+                    current_theta, questions_answered, final_report['final_tier'])
 
         return final_report
 
@@ -1661,6 +2319,50 @@ def create_simple_irt_engine(config=None):
     return engine
 
 
+# Question bank of a simulation worker process, built once by its initializer
+_simulation_bank: Optional[QuestionBank] = None
+
+
+def _init_simulation_worker(questions: List[Dict]) -> None:
+    global _simulation_bank
+    _simulation_bank = QuestionBank(questions)
+
+
+def _run_simulated_assessment(task: Tuple[str, int, Any, TestPurpose, bool]) -> Dict:
+    initial_competence, seed, config, test_purpose, enable_response_times = task
+    random.seed(seed)
+    engine = IRTEngine(config=config, test_purpose=test_purpose)
+    return engine.run_adaptive_assessment(initial_competence, _simulation_bank, enable_response_times)
+
+
+def run_adaptive_assessments(competence_levels: List[str], questions: List[Dict],
+                             config=None, test_purpose: TestPurpose = TestPurpose.DIAGNOSTIC,
+                             enable_response_times: bool = False, seeds: List[int] = None,
+                             max_workers: int = None) -> List[Dict]:
+    """
+    Run one simulated adaptive assessment per competence level across worker processes.
+
+    Each assessment gets a fresh engine and seeds `random` with its entry in
+    `seeds` (default: its position), so the reports do not depend on how tasks
+    are scheduled. Each worker builds the QuestionBank once; `questions` and
+    `config` must be picklable. Reports are returned in input order.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if seeds is None:
+        seeds = range(len(competence_levels))
+    tasks = [(competence, seed, config, test_purpose, enable_response_times)
+             for competence, seed in zip(competence_levels, seeds)]
+    if not tasks:
+        return []
+
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_simulation_worker,
+                             initargs=(questions,)) as executor:
+        return list(executor.map(_run_simulated_assessment, tasks,
+                                 chunksize=max(1, len(tasks) // (workers * 4))))
+
+
 def get_default_config():
     """Default configuration with sliding window theta updates"""
     return {
@@ -1714,6 +2416,22 @@ def get_default_config():
     }
 
 
+def _freeze_config(value):
+    """Read-only copy of a config section: dicts become mappingproxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze_config(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_config(item) for item in value)
+    return value
+
+
+# Shared by engines built without an explicit config, so constructing one does
+# not rebuild the nested dicts. Frozen, since every such engine (including the
+# long-lived one in main.py) holds references into it; get_default_config()
+# still hands callers their own mutable copy.
+_DEFAULT_CONFIG = _freeze_config(get_default_config())
+
+
 def get_config():
     """Legacy config loader"""
     default_config = get_default_config()
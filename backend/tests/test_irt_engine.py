@@ -0,0 +1,554 @@
+"""
+Tests for the IRT engine: array-backed helpers, the numeric kernels and question
+selection (against the loops they replaced and the original engine's choices),
+and the parallel simulation runner
+"""
+
+import math
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if backend_dir not in sys.path:
+    sys.path.insert(0, backend_dir)
+
+import irt_engine
+from irt_engine import (IRTEngine, QuestionBank, ResponseBatch, ResponseHistory,
+                        run_adaptive_assessments)
+
+
+def make_questions(count=120):
+    """Deterministic bank spread over all four tiers' difficulty and discrimination ranges"""
+    return [
+        {
+            'id': i,
+            'difficulty_b': -2.5 + 5.0 * i / (count - 1),
+            'discrimination_a': 0.6 + 1.8 * ((i * 7) % count) / count,
+            'guessing_c': 0.25,
+            'content_area': f"area_{i % 3}",
+        }
+        for i in range(count)
+    ]
+
+
+def run_fixed_pattern(engine, questions, pattern, competence="intermediate"):
+    """Select, answer as `pattern` says and update theta; returns (selected ids, theta after each answer)"""
+    theta = engine.initialize_assessment(competence)
+    responses, history, selected, thetas = [], [], [], []
+    for answered, is_correct in enumerate(pattern):
+        question = engine.select_next_question(theta, questions, history, answered)
+        selected.append(question['id'])
+        responses.append((is_correct, question['difficulty_b'], question['discrimination_a'],
+                          question['guessing_c']))
+        history.append(is_correct)
+        theta, _ = engine.update_theta(theta, responses, history, questions_answered=answered + 1)
+        thetas.append(theta)
+    return selected, thetas
+
+
+RESPONSES = [
+    (True, -1.2, 0.9, 0.25),
+    (False, 0.4, 1.3, 0.2),
+    (True, 1.1, 2.0, 0.25),
+    (False, -0.3, 0.7, 0.15),
+]
+
+
+# ResponseBatch
+
+def test_response_batch_round_trip():
+    batch = ResponseBatch(capacity=1)
+    for response in RESPONSES:
+        batch.append(response)
+
+    assert len(batch) == len(RESPONSES)
+    assert list(batch) == RESPONSES
+    assert batch[1] == RESPONSES[1]
+    assert list(batch[1:3]) == RESPONSES[1:3]
+    assert batch.is_correct.tolist() == [r[0] for r in RESPONSES]
+    assert batch.b.tolist() == [r[1] for r in RESPONSES]
+    assert batch.a.tolist() == [r[2] for r in RESPONSES]
+    assert batch.g.tolist() == [r[3] for r in RESPONSES]
+
+
+def test_response_batch_from_responses():
+    batch = ResponseBatch.from_responses(RESPONSES)
+    assert list(batch) == RESPONSES
+    assert ResponseBatch.from_responses(batch) is batch
+    assert len(ResponseBatch.from_responses([])) == 0
+
+
+@pytest.mark.parametrize("bad", [(True, None, 1.0, 0.25), (False, 0.0, float('nan'), 0.25)])
+def test_response_batch_rejects_non_finite(bad):
+    batch = ResponseBatch()
+    with pytest.raises(ValueError):
+        batch.append(bad)
+    assert len(batch) == 0
+    with pytest.raises(ValueError):
+        ResponseBatch.from_responses(RESPONSES + [bad])
+
+
+def test_calculate_sem_accepts_batch_and_tuples():
+    engine = IRTEngine()
+    batch = ResponseBatch.from_responses(RESPONSES)
+    triples = [r[1:] for r in RESPONSES]
+    assert engine.calculate_sem(0.3, batch) == engine.calculate_sem(0.3, triples)
+    assert engine.calculate_sem(0.3, []) == 1.0
+    with pytest.raises(ValueError):
+        engine.calculate_sem(0.3, list(RESPONSES[:3]))
+
+
+@pytest.mark.parametrize("bad", [(None, 1.0, 0.25), (0.5, float('nan'), 0.25), (0.5, 1.0, None)])
+def test_calculate_sem_rejects_missing_item_parameters(bad):
+    # Nullable item bank columns must fail loudly instead of giving a NaN SEM
+    engine = IRTEngine()
+    with pytest.raises(ValueError):
+        engine.calculate_sem(0.3, [r[1:] for r in RESPONSES] + [bad])
+
+
+# calculate_response_time_adjustment
+
+def reference_response_time_adjustment(theta, responses, response_times):
+    """Per-response loop the vectorised adjustment replaced"""
+    adjustments = []
+    for (is_correct, difficulty, _, _), response_time in zip(responses, response_times):
+        time_ratio = response_time / (5.0 + 2.0 * abs(theta - difficulty))
+        if is_correct and time_ratio < 0.7:
+            adjustments.append(0.05)
+        elif not is_correct and time_ratio > 1.5:
+            adjustments.append(-0.05)
+        elif is_correct and time_ratio > 2.0:
+            adjustments.append(-0.02)
+    return sum(adjustments)
+
+
+def test_response_time_adjustment_matches_reference():
+    engine = IRTEngine()
+    rng = random.Random(3)
+    for _ in range(50):
+        theta = rng.uniform(-3, 3)
+        responses = [(rng.random() < 0.5, rng.uniform(-3, 3), rng.uniform(0.5, 2.5), 0.25)
+                     for _ in range(rng.randint(1, 30))]
+        response_times = [rng.uniform(0.5, 40.0) for _ in responses]
+        assert engine.calculate_response_time_adjustment(theta, responses, response_times) == pytest.approx(
+            reference_response_time_adjustment(theta, responses, response_times), abs=1e-12)
+
+
+def test_response_time_adjustment_cases():
+    engine = IRTEngine()
+    # Expected time at theta=0, b=0 is 5s: fast correct, slow wrong, very slow correct, neutral
+    responses = [(True, 0.0, 1.0, 0.25), (False, 0.0, 1.0, 0.25),
+                 (True, 0.0, 1.0, 0.25), (True, 0.0, 1.0, 0.25)]
+    assert engine.calculate_response_time_adjustment(0.0, responses, [2.0, 10.0, 12.0, 5.0]) == pytest.approx(
+        0.05 - 0.05 - 0.02)
+    assert engine.calculate_response_time_adjustment(0.0, responses, [2.0]) == 0.0
+
+
+# Newton-Raphson update
+
+def identical_responses(rng, is_correct):
+    return [(is_correct, rng.uniform(-2.5, 2.5), rng.uniform(0.5, 2.5), 0.25)
+            for _ in range(rng.randint(1, 8))]
+
+
+def test_identical_response_direction():
+    engine = IRTEngine()
+    rng = random.Random(5)
+    for responses, expected in ((identical_responses(rng, True), 1),
+                                (identical_responses(rng, False), -1),
+                                (RESPONSES, 0)):
+        is_correct, difficulty, discrimination, guessing = irt_engine._response_columns(responses)
+        assert engine._identical_response_direction(0.0, is_correct, difficulty, discrimination,
+                                                    guessing, 0.2) == expected
+
+
+def test_newton_march_matches_full_loop(monkeypatch):
+    rng = random.Random(5)
+    cases = [(identical_responses(rng, rng.random() < 0.5), rng.uniform(-2, 2), answered)
+             for answered in (1, 3, 8, 20) for _ in range(10)]
+
+    engine = IRTEngine()
+    marched = [engine._calculate_theta_with_newton_raphson(theta, responses, answered)
+               for responses, theta, answered in cases]
+    monkeypatch.setattr(IRTEngine, '_identical_response_direction', lambda *args: 0)
+    full = [engine._calculate_theta_with_newton_raphson(theta, responses, answered)
+            for responses, theta, answered in cases]
+
+    for (marched_theta, marched_info), (full_theta, full_info) in zip(marched, full):
+        assert marched_theta == pytest.approx(full_theta, abs=1e-12)
+        assert marched_info['iterations_used'] == full_info['iterations_used']
+        assert marched_info['converged'] == full_info['converged']
+
+
+@pytest.mark.skipif(not irt_engine.NUMBA_AVAILABLE, reason="numba not installed")
+def test_compiled_newton_loop_matches_python():
+    rng = random.Random(9)
+    for _ in range(30):
+        responses = [(rng.random() < 0.5, rng.uniform(-2.5, 2.5), rng.uniform(0.5, 2.5), 0.25)
+                     for _ in range(rng.randint(1, 20))]
+        columns = irt_engine._response_columns(responses)
+        args = (rng.uniform(-2, 2),) + columns + (1e-4, 10, 0.3, 0, 1e-6, 0.001, 1.0, -3.0, 3.0)
+        compiled = irt_engine._newton_raphson_loop(*args)
+        python = irt_engine._newton_raphson_loop_py(*args)
+        assert compiled[0] == pytest.approx(python[0], abs=1e-12)
+        assert compiled[1:] == python[1:]
+
+
+def reference_nr_derivatives(theta, responses, epsilon):
+    """Branching per-response derivatives the fused p*q form replaced"""
+    likelihood_derivative = second_derivative = 0.0
+    for is_correct, difficulty, discrimination, guessing in responses:
+        p = min(max(irt_engine._probability_3pl(theta, difficulty, discrimination, guessing),
+                    epsilon), 1 - epsilon)
+        q = 1 - p
+        likelihood_derivative += discrimination * q / p if is_correct else -discrimination * p / q
+        second_derivative -= discrimination ** 2 * p * q
+    return likelihood_derivative, second_derivative
+
+
+def test_nr_derivatives_match_branching_form():
+    rng = random.Random(11)
+    for _ in range(50):
+        theta = rng.uniform(-3, 3)
+        responses = [(rng.random() < 0.5, rng.uniform(-3, 3), rng.uniform(0.3, 2.8), rng.uniform(0.0, 0.35))
+                     for _ in range(rng.randint(1, 25))]
+        columns = irt_engine._response_columns(responses)
+        expected = reference_nr_derivatives(theta, responses, 1e-4)
+        assert irt_engine._nr_derivatives_numpy(theta, *columns, 1e-4) == pytest.approx(expected, rel=1e-9)
+        assert irt_engine._nr_derivatives(theta, *columns, 1e-4) == pytest.approx(expected, rel=1e-9)
+
+
+# Thetas of the original engine for mixed answers
+# (diagnostic purpose, intermediate start, make_questions() bank)
+MIXED_PATTERN = [True, True, False, True, False, False, True, True, True, False, True, False, True, True, False]
+MIXED_ANSWER_BASELINE_THETAS = [0.2, 0.4, 0.4, 0.6, 0.6, 0.528989638563, 0.528989638563, 0.57689947462,
+                                0.57689947462, 0.519475165406, 0.519475165406, 0.501775665112,
+                                0.501775665112, 0.501775665112, 0.477656432229]
+
+
+def test_theta_path_for_mixed_answers_matches_baseline():
+    _, thetas = run_fixed_pattern(IRTEngine(), make_questions(), MIXED_PATTERN)
+    assert thetas == pytest.approx(MIXED_ANSWER_BASELINE_THETAS, abs=1e-9)
+
+
+# Selected ids and thetas of the original engine for twelve identical answers
+# (diagnostic purpose, intermediate start, make_questions() bank)
+IDENTICAL_ANSWER_BASELINE = {
+    True: ([64, 81, 98, 99, 101, 102, 118, 119, 117, 116, 115, 114],
+           [0.2, 0.4, 0.6, 0.8, 1.0, 1.4, 1.8, 2.2, 2.52, 2.712, 2.856, 2.928]),
+    False: ([64, 44, 43, 42, 25, 24, 23, 22, 21, 20, 19, 18],
+            [-0.2, -0.4, -0.6, -0.8, -1.0, -1.4, -1.8, -2.2, -2.52, -2.712, -2.856, -2.928]),
+}
+
+
+@pytest.mark.parametrize("is_correct", [True, False])
+def test_theta_path_for_identical_answers_matches_baseline(is_correct):
+    selected, thetas = run_fixed_pattern(IRTEngine(), make_questions(), [is_correct] * 12)
+    expected_ids, expected_thetas = IDENTICAL_ANSWER_BASELINE[is_correct]
+    assert selected == expected_ids
+    assert thetas == pytest.approx(expected_thetas, abs=1e-9)
+
+
+# Fallback estimators
+
+def random_responses(rng, count):
+    return [(rng.random() < 0.5, rng.uniform(-3, 3), rng.uniform(0.3, 2.8), rng.uniform(0.0, 0.35))
+            for _ in range(count)]
+
+
+def reference_eap(engine, responses, prior_theta):
+    """Grid-point-by-grid-point EAP the vectorised version replaced"""
+    theta_range = np.linspace(engine.theta_bounds[0], engine.theta_bounds[1], 100)
+    prior = np.exp(-0.5 * (theta_range - prior_theta) ** 2) / np.sqrt(2 * np.pi)
+    likelihood = np.ones_like(theta_range)
+    for is_correct, difficulty, discrimination, guessing in responses:
+        for i, theta in enumerate(theta_range):
+            p = engine.probability_correct(theta, difficulty, discrimination, guessing)
+            likelihood[i] *= p if is_correct else 1 - p
+    posterior = likelihood * prior
+    posterior /= np.sum(posterior)
+    return float(np.sum(theta_range * posterior))
+
+
+def test_eap_estimate_matches_reference():
+    engine = IRTEngine()
+    rng = random.Random(13)
+    for count in (1, 2, 5, 10, 25, 40):
+        responses = random_responses(rng, count)
+        for prior_theta in (0.0, -1.2, 0.7):
+            assert engine.calculate_eap_estimate(responses, prior_theta) == pytest.approx(
+                reference_eap(engine, responses, prior_theta), abs=1e-9)
+
+
+def reference_mle(engine, responses):
+    """Grid search with a scalar log-likelihood per point, as the vectorised version replaced"""
+    theta_range = np.linspace(engine.theta_bounds[0], engine.theta_bounds[1], 200)
+    log_likelihoods = []
+    for theta in theta_range:
+        log_likelihood = 0.0
+        for is_correct, difficulty, discrimination, guessing in responses:
+            p = engine.probability_correct(theta, difficulty, discrimination, guessing)
+            log_likelihood += np.log(max(p, 1e-10)) if is_correct else np.log(max(1 - p, 1e-10))
+        log_likelihoods.append(log_likelihood)
+    return float(theta_range[np.argmax(log_likelihoods)])
+
+
+def test_mle_estimate_matches_reference():
+    engine = IRTEngine()
+    rng = random.Random(17)
+    for count in (1, 2, 5, 10, 25, 40):
+        for _ in range(5):
+            responses = random_responses(rng, count)
+            assert engine.calculate_mle_estimate(responses) == reference_mle(engine, responses)
+    # All correct / all incorrect: the likelihood peaks at the grid ends
+    assert engine.calculate_mle_estimate([(True, 0.0, 1.0, 0.25)] * 3) == engine.theta_bounds[1]
+    assert engine.calculate_mle_estimate([(False, 0.0, 1.0, 0.25)] * 3) == engine.theta_bounds[0]
+
+
+# Question selection
+
+def small_c2_bank():
+    """Six questions inside the C2 difficulty and discrimination ranges"""
+    areas = ['area_0', 'area_1', 'area_1', 'area_2', 'area_0', 'area_2']
+    return [{'id': i + 1, 'difficulty_b': -0.5 + 0.2 * i, 'discrimination_a': 1.0,
+             'guessing_c': 0.25, 'content_area': area}
+            for i, area in enumerate(areas)]
+
+
+def equal_information(monkeypatch):
+    """Make every candidate equally informative, so selection is decided by the tie rules"""
+    monkeypatch.setattr(IRTEngine, '_candidate_information',
+                        lambda self, theta, bank, rows: np.ones(len(rows)))
+
+
+# Selected ids of the original engine for MIXED_PATTERN (diagnostic purpose,
+# which balances content, intermediate start, make_questions() bank)
+CONTENT_BALANCED_BASELINE_IDS = [64, 81, 98, 80, 97, 63, 62, 79, 99, 101, 78, 94, 61, 77, 96]
+
+
+def test_content_balanced_selection_matches_baseline():
+    engine = IRTEngine(test_purpose=irt_engine.TestPurpose.DIAGNOSTIC)
+    assert engine.adaptive_config.enable_content_balancing
+    selected, _ = run_fixed_pattern(engine, make_questions(), MIXED_PATTERN)
+    assert selected == CONTENT_BALANCED_BASELINE_IDS
+
+
+def test_content_balanced_selection_takes_first_of_equal_scores(monkeypatch):
+    equal_information(monkeypatch)
+    engine = IRTEngine()
+    question = engine.select_next_question_with_content_balance(-0.5, small_c2_bank(), [], 0)
+    assert question['id'] == 1
+    assert engine.asked_question_ids == {1}
+    assert engine.used_content_areas == {'area_0': 1}
+    assert engine.item_exposure_counts == {1: 1}
+    assert engine.last_question_difficulty == question['difficulty_b']
+
+
+def test_content_balanced_selection_applies_penalties(monkeypatch):
+    equal_information(monkeypatch)
+    engine = IRTEngine()
+    # area_0 is penalised (ids 1 and 5) and id 2 has been exposed, so id 3 scores highest
+    engine.used_content_areas = {'area_0': 2}
+    engine.item_exposure_counts = {2: 1}
+    question = engine.select_next_question_with_content_balance(-0.5, small_c2_bank(), [], 0)
+    assert question['id'] == 3
+
+
+def test_content_balanced_selection_skips_asked_questions():
+    engine = IRTEngine()
+    questions = small_c2_bank()
+    selected = [engine.select_next_question_with_content_balance(-0.5, questions, [], 0)['id']
+                for _ in questions]
+    assert sorted(selected) == [q['id'] for q in questions]
+    assert engine.select_next_question_with_content_balance(-0.5, questions, [], 0) is None
+
+
+# Selected ids of the original engine for MIXED_PATTERN (screening purpose,
+# which uses the original selector, intermediate start, make_questions() bank)
+ORIGINAL_SELECTOR_BASELINE_IDS = [64, 81, 97, 80, 98, 63, 62, 79, 99, 107, 78, 96, 61, 77, 95]
+
+
+def test_original_selection_matches_baseline():
+    engine = IRTEngine(test_purpose=irt_engine.TestPurpose.SCREENING)
+    assert not engine.adaptive_config.enable_content_balancing
+    selected, _ = run_fixed_pattern(engine, make_questions(), MIXED_PATTERN)
+    assert selected == ORIGINAL_SELECTOR_BASELINE_IDS
+
+
+def tie_break_bank():
+    # Distances from theta -0.25: 0.75, 0.25, 0.25, 1.0 (exact in binary)
+    return [{'id': i + 1, 'difficulty_b': b, 'discrimination_a': 1.0, 'guessing_c': 0.25}
+            for i, b in enumerate([0.5, 0.0, -0.5, 0.75])]
+
+
+def test_original_selection_breaks_ties_by_difficulty_distance(monkeypatch):
+    equal_information(monkeypatch)
+    engine = IRTEngine()
+    # The closest difficulty wins; of the two equally close, the first
+    assert engine._select_next_question_original(-0.25, tie_break_bank(), [], 0)['id'] == 2
+    assert engine._select_next_question_original(-0.25, tie_break_bank(), [], 0)['id'] == 3
+    assert engine.asked_question_ids == {2, 3}
+
+
+def test_original_selection_ignores_nan_information(monkeypatch):
+    monkeypatch.setattr(IRTEngine, '_candidate_information',
+                        lambda self, theta, bank, rows: np.array([math.nan, 0.4, 0.9, 0.2])[rows])
+    engine = IRTEngine()
+    assert engine._select_next_question_original(-0.25, tie_break_bank(), [], 0)['id'] == 3
+
+
+# ResponseHistory
+
+def test_response_history_round_trip():
+    flags = [True, True, False, False, False, True, False, True, True, True, True]
+    history = ResponseHistory()
+    for flag in flags:
+        history.append(flag)
+
+    assert len(history) == len(flags)
+    assert list(history) == flags
+    assert history[0] is True and history[-1] is True
+    assert history[2:6] == flags[2:6]
+    assert history.flags.tolist() == flags
+    assert np.asarray(history).tolist() == flags
+    assert history.tail_run == 4
+    assert history.longest_runs == (4, 3)
+
+
+def test_response_history_window_sum_matches_slices():
+    rng = random.Random(7)
+    flags = [rng.random() < 0.5 for _ in range(25)]
+    history = ResponseHistory()
+    for size, flag in enumerate(flags, start=1):
+        history.append(flag)
+        for window in range(-size - 2, size + 3):
+            assert history.window_sum(window) == sum(flags[:size][-window:]), (size, window)
+
+
+def test_response_history_empty():
+    history = ResponseHistory()
+    assert len(history) == 0
+    assert history.tail_run == 0
+    assert history.longest_runs == (0, 0)
+    assert history.window_sum(5) == 0
+
+
+# QuestionBank
+
+def test_question_bank_columns_and_tier_masks():
+    questions = make_questions()
+    bank = QuestionBank(questions)
+
+    assert bank.size == len(questions)
+    assert bank.difficulty.tolist() == [q['difficulty_b'] for q in questions]
+    assert bank.discrimination.tolist() == [q['discrimination_a'] for q in questions]
+
+    bounds = (-1.0, 1.0, 0.7, 1.7)
+    expected = [-1.0 <= q['difficulty_b'] <= 1.0 and 0.7 <= q['discrimination_a'] <= 1.7
+                for q in questions]
+    mask = bank.tier_mask(bounds)
+    assert mask.tolist() == expected
+    assert bank.tier_mask(bounds) is mask
+    assert bank.take(np.flatnonzero(mask)) == [q for q, keep in zip(questions, expected) if keep]
+
+
+def test_engine_tier_filter_matches_dict_filter():
+    engine = IRTEngine()
+    questions = make_questions()
+    for tier in ("C1", "C2", "C3", "C4"):
+        b_low, b_high = engine.tier_difficulty_ranges[tier]
+        a_low, a_high = engine.tier_discrimination_ranges[tier]
+        expected = [q for q in questions
+                    if b_low <= q['difficulty_b'] <= b_high and a_low <= q['discrimination_a'] <= a_high]
+        assert engine._filter_questions_by_tier(questions, tier) == expected
+
+
+def test_engine_tier_filter_sees_in_place_edits():
+    engine = IRTEngine()
+    questions = make_questions()
+    before = engine._filter_questions_by_tier(questions, "C1")
+    questions[before[0]['id']]['difficulty_b'] = 2.9
+    after = engine._filter_questions_by_tier(questions, "C1")
+    assert after == before[1:]
+
+
+def test_question_bank_id_lookup():
+    questions = make_questions(10)
+    questions.append({'id': 3, 'difficulty_b': 0.0, 'discrimination_a': 1.0})
+    bank = QuestionBank(questions)
+
+    mask = bank.rows_with_ids({3, 5, 'missing'})
+    assert np.flatnonzero(mask).tolist() == [3, 5, 10]
+    assert not bank.rows_with_ids([]).any()
+
+    counts = bank.counts_by_id({3: 2, 7: 1, 'missing': 9})
+    expected = [0.0] * len(questions)
+    expected[3] = expected[10] = 2.0
+    expected[7] = 1.0
+    assert counts.tolist() == expected
+
+
+def test_question_bank_counts_without_ids():
+    questions = make_questions(5)
+    del questions[2]['id']
+    bank = QuestionBank(questions)
+    assert bank.counts_by_id({0: 1}) is None
+    assert np.flatnonzero(bank.rows_with_ids({0, None})).tolist() == [0, 2]
+
+
+# Default config
+
+def test_default_config_is_read_only():
+    first, second = IRTEngine(), IRTEngine()
+    with pytest.raises(TypeError):
+        first.theta_bounds[0] = -10.0
+    with pytest.raises(TypeError):
+        first.tier_difficulty_ranges["C1"] = (-5.0, 5.0)
+    with pytest.raises(TypeError):
+        first.config["irt_config"]["history_window"] = 1
+    assert second.theta_bounds == (-3.0, 3.0)
+    assert second.tier_difficulty_ranges["C1"] == (-2.0, 0.0)
+
+
+# tier_history
+
+def test_tier_history_matches_theta_to_tier():
+    engine = IRTEngine()
+    engine.theta_history = [-3.0, -1.5, -1.0, -0.2, 0.0, 0.7, 1.0, 2.4, math.nan]
+    tiers = engine.tier_history()
+    assert tiers.tolist() == [engine.theta_to_tier(theta) for theta in engine.theta_history]
+    assert tiers.tolist() == ["C1", "C1", "C2", "C2", "C3", "C3", "C4", "C4", "C4"]
+
+    engine.theta_history = []
+    assert engine.tier_history().tolist() == []
+
+
+# run_adaptive_assessments
+
+def test_run_adaptive_assessments_matches_sequential_runs():
+    questions = make_questions()
+    competence_levels = ["beginner", "intermediate", "advanced", "expert", "intermediate"]
+    seeds = [11, 12, 13, 14, 15]
+
+    parallel = run_adaptive_assessments(competence_levels, questions, seeds=seeds, max_workers=2)
+
+    sequential = []
+    for competence, seed in zip(competence_levels, seeds):
+        random.seed(seed)
+        sequential.append(IRTEngine().run_adaptive_assessment(competence, questions))
+
+    assert len(parallel) == len(sequential)
+    for parallel_report, sequential_report in zip(parallel, sequential):
+        assert parallel_report == sequential_report
+
+
+def test_run_adaptive_assessments_default_seeds_and_empty():
+    questions = make_questions()
+    reports = run_adaptive_assessments(["beginner", "advanced"], questions, max_workers=1)
+    random.seed(1)
+    assert reports[1] == IRTEngine().run_adaptive_assessment("advanced", questions)
+    assert run_adaptive_assessments([], questions) == []